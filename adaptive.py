@@ -0,0 +1,138 @@
+import random
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+
+
+# Hər bank (həş) və sual indeksi üçün cəhd və səhv sayları. WAL rejimi oxuyanları
+# yazana gözlətmir; bir imtahanın bütün nəticələri bir tranzaksiyada yazılır.
+class QuestionStats:
+    def __init__(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS question_stats ("
+            " bank TEXT NOT NULL, idx INTEGER NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0, errors INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (bank, idx)) WITHOUT ROWID"
+        )
+        self._db.commit()
+
+    def load(self, bank, size):
+        attempts = array("I", bytes(4 * size))
+        errors = array("I", bytes(4 * size))
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idx, attempts, errors FROM question_stats WHERE bank = ? AND idx < ?", (bank, size)
+            ).fetchall()
+        for idx, a, e in rows:
+            attempts[idx] = a
+            errors[idx] = e
+        return attempts, errors
+
+    # results: (sual indeksi, doğrudurmu) cütləri
+    def record(self, bank, results):
+        rows = [(bank, int(idx), 0 if correct else 1) for idx, correct in results]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO question_stats (bank, idx, attempts, errors) VALUES (?, ?, 1, ?)"
+                " ON CONFLICT (bank, idx) DO UPDATE SET"
+                " attempts = attempts + 1, errors = errors + excluded.errors",
+                rows,
+            )
+
+
+# Prefiks cəmləri ağacı: çəki dəyişməsi və çəkiyə görə seçim O(log n)
+class FenwickTree:
+    __slots__ = ("_tree", "_weights", "_top")
+
+    def __init__(self, weights):
+        n = len(weights)
+        self._weights = array("d", weights)
+        tree = array("d", [0.0]) * (n + 1)
+        for i, w in enumerate(self._weights, start=1):
+            tree[i] += w
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << max(n.bit_length() - 1, 0)
+
+    def __len__(self):
+        return len(self._weights)
+
+    def weight(self, i):
+        return self._weights[i]
+
+    def update(self, i, weight):
+        delta = weight - self._weights[i]
+        self._weights[i] = weight
+        i += 1
+        tree = self._tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def total(self):
+        i, s = len(self._weights), 0.0
+        while i:
+            s += self._tree[i]
+            i -= i & -i
+        return s
+
+    # Prefiks cəmi u-dan böyük olan ilk indeks
+    def find(self, u):
+        pos, step, tree = 0, self._top, self._tree
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= u:
+                pos = nxt
+                u -= tree[nxt]
+            step >>= 1
+        return min(pos, len(self._weights) - 1)
+
+
+# Laplace hamarlaşdırılmış səhv payı: heç cəhd edilməmiş sual 0.5, həmişə səhv edilən 1-ə yaxın
+def error_weight(attempts, errors):
+    return (errors + 1) / (attempts + 2)
+
+
+# Bir bank üçün bütün sessiyalar arasında paylaşılır; kilid seçim zamanı
+# müvəqqəti sıfırlanan çəkiləri başqa sessiyanın görməməsi üçündür.
+class AdaptiveSampler:
+    def __init__(self, attempts, errors):
+        self._attempts = attempts
+        self._errors = errors
+        self._tree = FenwickTree([error_weight(a, e) for a, e in zip(attempts, errors)])
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tree)
+
+    # Təkrarsız seçim: seçilən sualın çəkisi sıfırlanır, sonda bərpa olunur
+    def sample(self, k, rng=random):
+        k = min(k, len(self._tree))
+        picked = []
+        with self._lock:
+            try:
+                while len(picked) < k:
+                    i = self._tree.find(rng.random() * self._tree.total())
+                    if self._tree.weight(i) <= 0:
+                        continue
+                    picked.append(i)
+                    self._tree.update(i, 0.0)
+            finally:
+                for i in picked:
+                    self._tree.update(i, error_weight(self._attempts[i], self._errors[i]))
+        return picked
+
+    def record(self, results):
+        with self._lock:
+            for i, correct in results:
+                self._attempts[i] += 1
+                self._errors[i] += not correct
+                self._tree.update(i, error_weight(self._attempts[i], self._errors[i]))
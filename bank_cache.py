@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import threading
+import zlib
+from io import BytesIO
+
+# Parser çıxışının formatı və ya qaydaları dəyişəndə artırın — köhnə yazılar avtomatik keçərsiz
+# olur; bank_merge.combined_digest də bunu istifadə edir ki, sual statistikası yerini dəyişməsin
+FORMAT_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def bank_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+# Diskdə saxlanılan, SHA-256 açarlı, ölçü ilə məhdud LRU keşi
+class BankCache:
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            self.directory = None  # disk əlçatan deyil: keş yalnız "miss" sayır, hər dəfə parse olunur
+
+    def _path(self, namespace, digest):
+        return os.path.join(self.directory, f"{namespace}-v{FORMAT_VERSION}-{digest}.json.z")
+
+    def contains(self, namespace, digest):
+        return self.directory is not None and os.path.exists(self._path(namespace, digest))
+
+    def get(self, namespace, digest):
+        if self.directory is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        path = self._path(namespace, digest)
+        try:
+            with open(path, "rb") as fh:
+                value = json.loads(zlib.decompress(fh.read()))
+            os.utime(path)  # LRU: son istifadə vaxtını yenilə
+        except (OSError, ValueError, zlib.error):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, namespace, digest, value):
+        if self.directory is None:
+            return
+        path = self._path(namespace, digest)
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, path)
+        self._evict()
+
+    def get_or_parse(self, namespace, data, parse, restore=None):
+        digest = bank_digest(data)
+        value = self.get(namespace, digest)
+        if value is not None:
+            return restore(value) if restore else value
+        value = parse(BytesIO(data))
+        try:
+            self.put(namespace, digest, value)
+        except OSError:
+            pass  # keş yazıla bilmirsə, sadəcə parse nəticəsini qaytarırıq
+        return value
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".json.z"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def restore_question_blocks(value):
+    return [(text, options) for text, options in value]
@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import time
+import uuid
+
+import streamlit as st
+
+from adaptive import AdaptiveSampler, QuestionStats
+from bank_cache import BankCache, DEFAULT_MAX_BYTES, bank_digest, restore_question_blocks
+from bank_merge import combined_digest, merge_question_blocks
+from bank_parser import parse_question_blocks, parse_open_question_list
+from parse_jobs import ParseJobs
+from profiling import mark_cache_miss, stage
+from question_bank import QuestionBank
+from search_index import QueryError, SearchIndex
+
+
+@st.cache_resource
+def get_bank_cache():
+    return BankCache(
+        os.environ.get("IMTAHAN_CACHE_DIR", ".cache/banks"),
+        int(os.environ.get("IMTAHAN_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    )
+
+
+# Statistika istəyə bağlıdır: baza açıla bilmirsə None (adaptiv rejim gizlədilir, nəticələr yazılmır)
+@st.cache_resource
+def get_stats_store():
+    try:
+        return QuestionStats(os.environ.get("IMTAHAN_STATS_DB", ".cache/stats.sqlite3"))
+    except (OSError, sqlite3.Error):
+        return None
+
+
+# Bir bank üçün bir dəfə SQLite-dan yüklənir, sonra cavablarla yerində yenilənir
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_adaptive_sampler(digest, size):
+    return AdaptiveSampler(*get_stats_store().load(digest, size))
+
+
+# Yazma xətası nəticənin göstərilməsinə mane olmamalıdır — statistika sadəcə atlanır
+def record_exam_results(digest, size, results):
+    if get_stats_store() is None:
+        return
+    try:
+        sampler = get_adaptive_sampler(digest, size)  # yazmadan əvvəl yüklənməlidir ki, nəticə iki dəfə sayılmasın
+        get_stats_store().record(digest, results)
+    except (OSError, sqlite3.Error):
+        return
+    sampler.record(results)
+
+
+@st.cache_resource
+def get_parse_jobs():
+    return ParseJobs()
+
+
+# Keşdə olmayan faylları fon axınında parse edir və bitənə qədər irəliləyişi göstərir.
+# Rerun (məs. təkrar klik) gözləməni kəsir, amma iş davam edir və növbəti run eyni işə qoşulur.
+def wait_for_parse(namespace, files, parse, restore=None):
+    jobs, cache = get_parse_jobs(), get_bank_cache()
+    owner = st.session_state.setdefault("parse_owner", uuid.uuid4().hex)
+    cancelled = st.session_state.setdefault("parse_cancelled", set())
+    pending = []
+    for f in files:
+        data = f.getvalue()
+        key = (namespace, bank_digest(data))
+        if jobs.ready(key) or cache.contains(*key):
+            continue
+        if key in cancelled:
+            st.warning(f"⏹️ **{f.name}** faylının oxunması dayandırıldı.")
+            if st.button("🔁 Yenidən oxu", key=f"parse_retry_{key[1][:16]}"):
+                cancelled.discard(key)
+                st.rerun()
+            st.stop()
+        pending.append(jobs.submit(key, owner, lambda progress, data=data: cache.get_or_parse(
+            namespace, data, lambda buf: parse(buf, progress), restore)))
+    if not pending:
+        return
+
+    box = st.empty()
+    with box.container():
+        bar = st.progress(0.0, text="⏳ Fayl oxunur...")
+        if st.button("⏹️ Dayandır", key="parse_cancel"):
+            for job in pending:
+                cancelled.add(job.key)
+                job.detach(owner)
+            st.rerun()
+    while not all(job.done() for job in pending):
+        paragraphs = sum(job.paragraphs for job in pending)
+        fraction = sum(job.fraction for job in pending) / len(pending)
+        bar.progress(fraction, text=f"⏳ Fayl oxunur: {paragraphs} paraqraf işləndi ({fraction:.0%})")
+        time.sleep(0.2)
+    box.empty()
+
+
+# Fon işi bitibsə nəticəsi birbaşa götürülür, yoxsa (məs. rerun zamanı) adi yol
+def _parsed(namespace, data, parse, restore=None):
+    found, value = get_parse_jobs().take((namespace, bank_digest(data)))
+    if found:
+        return value
+    return get_bank_cache().get_or_parse(namespace, data, parse, restore)
+
+
+@st.cache_data
+def _parse_docx(file):
+    mark_cache_miss()
+    return _parsed("mcq", file.getvalue(), parse_question_blocks, restore_question_blocks)
+
+
+@st.cache_data
+def _parse_open_questions(file):
+    mark_cache_miss()
+    return _parsed("open", file.getvalue(), parse_open_question_list)
+
+
+def parse_docx(file):
+    with stage("parse_docx"):
+        wait_for_parse("mcq", [file], parse_question_blocks, restore_question_blocks)
+        return _parse_docx(file)
+
+
+def parse_open_questions(file):
+    with stage("parse_open_questions"):
+        wait_for_parse("open", [file], parse_open_question_list)
+        return _parse_open_questions(file)
+
+
+def bank_files_digest(files, near_duplicates=False):
+    return combined_digest([bank_digest(f.getvalue()) for f in files], near_duplicates)
+
+
+# Bir neçə fayl birləşdirilir; nəticə faylların birgə həşi ilə keşlənir və
+# sessiyalar arasında paylaşılır (yalnız oxunur), hər rerun-da surət çıxarılmır
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _merge_banks(digest, _files, near_duplicates):
+    mark_cache_miss()
+    return merge_question_blocks([parse_docx(f) for f in _files], near_duplicates)
+
+
+def load_merged_blocks(files, near_duplicates=False, digest=None):
+    digest = digest or bank_files_digest(files, near_duplicates)
+    with stage("merge_banks"):
+        # Bütün fayllar birlikdə fonda oxunur; keşlənmiş funksiyanın içində UI yaradılmır
+        wait_for_parse("mcq", files, parse_question_blocks, restore_question_blocks)
+        return _merge_banks(digest, files, near_duplicates)
+
+
+# Bank bir dəfə qurulur, sessiyalar yalnız indeksləri saxlayır
+@st.cache_resource(max_entries=16)
+def build_question_bank(digest, _blocks):
+    return QuestionBank(_blocks)
+
+
+# İndeks yalnız filtr ilk dəfə istifadə olunanda qurulur və bank üçün paylaşılır
+@st.cache_resource(max_entries=16, show_spinner="🔎 Axtarış indeksi qurulur...")
+def build_search_index(digest, _blocks):
+    return SearchIndex(_blocks)
+
+
+QUERY_HELP = (
+    "Boşluq — hamısı olmalıdır (VƏ); `OR` və ya `|` — biri kifayətdir; `-söz` və ya `NOT söz` — istisna; "
+    "`(...)` qruplaşdırma; `\"dırnaq içində\"` — sözlər ardıcıl gəlməlidir; `söz*` — sözün əvvəli. "
+    "Böyük/kiçik hərf fərqi yoxdur; i, ı, I və İ eyni hərf sayılır."
+)
+
+
+# Boş sorğu → None (filtr yoxdur); əks halda uyğun sual indeksləri artan sıra ilə
+def filter_questions(digest, blocks, query):
+    if not query.strip():
+        return None
+    with stage("search"):
+        try:
+            return build_search_index(digest, blocks).search(query).tolist()
+        except QueryError as e:
+            st.error(f"❗ Axtarış sorğusu səhvdir: {e}")
+            return []
+
+
+def load_question_bank(files, near_duplicates=False):
+    digest = bank_files_digest(files, near_duplicates)
+    merged = load_merged_blocks(files, near_duplicates, digest)
+    with stage("load_question_bank"):
+        return digest, build_question_bank(digest, merged.blocks), merged
+
+
+def show_merge_report(merged, files):
+    if len(files) < 2 and not merged.exact_removed and not merged.clusters:
+        return
+    collapsed = sum(len(c["collapsed"]) for c in merged.clusters)
+    with st.expander(f"🧹 Birləşdirmə hesabatı: {len(merged.blocks)} unikal sual"):
+        counts = [0] * len(files)
+        for source in merged.sources:
+            counts[source] += 1
+        st.markdown("\n".join(f"- **{f.name}**: {c} sual qaldı" for f, c in zip(files, counts)))
+        st.markdown(f"♻️ Eyni suallar çıxarıldı: **{merged.exact_removed}**")
+        if merged.clusters:
+            st.markdown(f"🔗 Oxşar sual qrupları: **{len(merged.clusters)}** (çıxarılan: {collapsed})")
+            for cluster in merged.clusters[:50]:
+                st.markdown(
+                    f"**Saxlanıldı:** {cluster['kept']}  \n"
+                    + "  \n".join(f"↳ ~{cluster['similarity']:.0%} {q}" for q in cluster["collapsed"])
+                )
+            if len(merged.clusters) > 50:
+                st.caption(f"… və daha {len(merged.clusters) - 50} qrup")
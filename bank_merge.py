@@ -0,0 +1,143 @@
+import hashlib
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from bank_cache import FORMAT_VERSION
+from search_index import az_casefold
+
+# Birləşdirmə/normallaşdırma qaydaları (dedup, LSH, hərf qatlama) dəyişəndə artırın:
+# birgə həş dəyişir, sual indeksinə bağlı statistika köhnə suallara yapışmır
+MERGE_FORMAT_VERSION = 1
+
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 8                      # 8 zolaq × 8 sətir → ~0.77 Jaccard həddi
+NEAR_DUPLICATE_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+
+_non_word = re.compile(r"[\W_]+")
+
+MergeResult = namedtuple("MergeResult", "blocks sources exact_removed clusters")
+
+
+def normalize_text(text):
+    text = az_casefold(text)
+    return " ".join(_non_word.sub(" ", text).split())
+
+
+def _exact_key(question, options):
+    # Eyni sual: eyni mətn, eyni doğru cavab və eyni variant dəsti (sıradan asılı olmayaraq)
+    correct, *others = (normalize_text(o) for o in options)
+    payload = "\x1f".join([normalize_text(question), correct, *sorted(others)])
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+# banks: hər fayl üçün parse_docx nəticəsi. Sıra saxlanılır, hər qrupdan ilk rast gəlinən qalır.
+def merge_question_blocks(banks, near_duplicates=False):
+    blocks, sources = [], []
+    seen = set()
+    exact_removed = 0
+    for file_index, bank in enumerate(banks):
+        for question, options in bank:
+            key = _exact_key(question, options)
+            if key in seen:
+                exact_removed += 1
+                continue
+            seen.add(key)
+            blocks.append((question, options))
+            sources.append(file_index)
+
+    clusters = []
+    if near_duplicates and len(blocks) > 1:
+        keep, clusters = _collapse_near_duplicates(blocks)
+        blocks = [blocks[i] for i in keep]
+        sources = [sources[i] for i in keep]
+    return MergeResult(blocks, sources, exact_removed, clusters)
+
+
+def _shingles(text):
+    words = normalize_text(text).split()
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return np.array(
+        [int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little") for g in set(grams)],
+        dtype=np.uint64,
+    )
+
+
+def minhash_signatures(texts, permutations=MINHASH_PERMUTATIONS, seed=1, chunk=4096):
+    # x → a·x + b (mod 2^64), tək a ilə — uint64 üzərində permutasiya
+    rng = np.random.default_rng(seed)
+    top = np.iinfo(np.uint64).max
+    a = rng.integers(0, top, permutations, dtype=np.uint64, endpoint=True) | np.uint64(1)
+    b = rng.integers(0, top, permutations, dtype=np.uint64, endpoint=True)
+    signatures = np.empty((len(texts), permutations), dtype=np.uint64)
+    # Sənədlər hissə-hissə: bütün shingle-lar × permutasiyalar bir matrisdə, sonra reduceat ilə min
+    for start in range(0, len(texts), chunk):
+        shingles = [_shingles(t) for t in texts[start:start + chunk]]
+        offsets = np.cumsum([0] + [len(s) for s in shingles[:-1]])
+        values = np.concatenate(shingles)[:, None]
+        with np.errstate(over="ignore"):
+            hashed = values * a + b
+        signatures[start:start + len(shingles)] = np.minimum.reduceat(hashed, offsets, axis=0)
+    return signatures
+
+
+def _collapse_near_duplicates(blocks, threshold=NEAR_DUPLICATE_THRESHOLD):
+    signatures = minhash_signatures([q for q, _ in blocks])
+    correct = [normalize_text(options[0]) for _, options in blocks]
+    parent = list(range(len(blocks)))
+    similarity = {}
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Vedrə açarı zolaq imzası + doğru cavabdır: fərqli cavablı sual vedrəni "tutmur".
+    # Vedrədə hər qrupdan bir nümayəndə saxlanılır və yeni sual onların hamısı ilə müqayisə olunur.
+    rows = signatures.shape[1] // LSH_BANDS
+    for band in range(LSH_BANDS):
+        buckets = {}
+        band_bytes = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        for i in range(len(blocks)):
+            representatives = buckets.setdefault((band_bytes[i].tobytes(), correct[i]), [])
+            joined = False
+            for rep in representatives:
+                ri, rr = find(i), find(rep)
+                if ri == rr:
+                    joined = True
+                    continue
+                score = float(np.mean(signatures[rep] == signatures[i]))
+                if score >= threshold:
+                    parent[max(ri, rr)] = min(ri, rr)
+                    similarity[i] = max(similarity.get(i, 0.0), score)
+                    joined = True
+            if not joined:
+                representatives.append(i)
+
+    members = {}
+    for i in range(len(blocks)):
+        members.setdefault(find(i), []).append(i)
+    keep = sorted(members)
+    clusters = [
+        {
+            "kept": blocks[root][0],
+            "collapsed": [blocks[i][0] for i in group[1:]],
+            "similarity": round(min(similarity.get(i, 1.0) for i in group[1:]), 2),
+        }
+        for root, group in sorted(members.items()) if len(group) > 1
+    ]
+    return keep, clusters
+
+
+def combined_digest(digests, near_duplicates=False):
+    h = hashlib.sha256(f"parse-v{FORMAT_VERSION}:merge-v{MERGE_FORMAT_VERSION}:".encode("ascii"))
+    for d in digests:
+        h.update(d.encode("ascii"))
+    h.update(b"near" if near_duplicates else b"exact")
+    return h.hexdigest()
@@ -0,0 +1,125 @@
+import re
+import zipfile
+from xml.etree import ElementTree as ET
+
+question_pattern = re.compile(r"^\d+\s*[.)]\s*")
+option_pattern = re.compile(r"^[A-Ea-e]\)")
+open_question_pattern = re.compile(r"^\s*\d+\s*[.)]?\s*")
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+BODY, P, R, HYPERLINK = W + "body", W + "p", W + "r", W + "hyperlink"
+
+# python-docx-dəki Run.text ilə eyni mətn ekvivalentləri
+RUN_TEXT = {W + "tab": "\t", W + "ptab": "\t", W + "cr": "\n", W + "noBreakHyphen": "-"}
+
+# Stream oxuna bilməyəndə python-docx-ə keçirik
+STREAM_ERRORS = (zipfile.BadZipFile, KeyError, ET.ParseError)
+
+# progress(paraqraf sayı, oxunmuş pay) bu qədər paraqrafdan bir çağırılır
+PROGRESS_EVERY = 64
+
+
+def iter_stream_paragraphs(file, progress=None):
+    # word/document.xml faylını DOM qurmadan oxuyur, yalnız gövdə səviyyəli
+    # (doc.paragraphs-dakı kimi) boş olmayan paraqrafları qaytarır
+    with zipfile.ZipFile(file) as zf, zf.open("word/document.xml") as xml:
+        size = zf.getinfo("word/document.xml").file_size or 1
+        count = 0
+        stack = []
+        parts = []
+        body = None
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            if event == "start":
+                stack.append(elem.tag)
+                if elem.tag == BODY:
+                    body = elem
+                continue
+
+            tag = stack.pop()
+            depth = len(stack)
+            if body is not None and depth >= 3 and stack[-1] == R and _in_body_paragraph(stack):
+                if tag == W + "t":
+                    parts.append(elem.text or "")
+                elif tag == W + "br":
+                    if elem.get(W + "type", "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag in RUN_TEXT:
+                    parts.append(RUN_TEXT[tag])
+            elif depth >= 1 and stack[-1] == BODY:
+                if tag == P:
+                    text = "".join(parts).strip()
+                    if text:
+                        count += 1
+                        if progress and count % PROGRESS_EVERY == 0:
+                            progress(count, min(xml.tell() / size, 1.0))
+                        yield text
+                parts.clear()
+                body.clear()
+
+
+def _in_body_paragraph(stack):
+    # stack[-1] == w:r; w:body/w:p/w:r və ya w:body/w:p/w:hyperlink/w:r
+    if stack[-2] == P:
+        return stack[-3] == BODY
+    return len(stack) >= 4 and stack[-2] == HYPERLINK and stack[-3] == P and stack[-4] == BODY
+
+
+def iter_docx_paragraphs(file, progress=None):
+    from docx import Document
+
+    doc = Document(file)
+    paragraphs = doc.paragraphs
+    for i, p in enumerate(paragraphs, start=1):
+        if progress and i % PROGRESS_EVERY == 0:
+            progress(i, i / len(paragraphs))
+        text = p.text.strip()
+        if text:
+            yield text
+
+
+def iter_question_blocks(paragraphs):
+    question_lines = None
+    options = []
+
+    for text in paragraphs:
+        if question_lines is not None:
+            if option_pattern.match(text):
+                options.append(text[2:].strip())
+                continue
+            if not options:
+                # SUAL MƏTNİ — A) görünənə qədər
+                question_lines.append(text)
+                continue
+            if len(options) >= 4:
+                yield "\n".join(question_lines), options
+            question_lines = None
+
+        if question_pattern.match(text):
+            question_lines = [question_pattern.sub("", text)]
+            options = []
+
+    if question_lines is not None and len(options) >= 4:
+        yield "\n".join(question_lines), options
+
+
+def iter_open_questions(paragraphs):
+    for p in paragraphs:
+        p = open_question_pattern.sub("", p)
+        if p:
+            yield p
+
+
+def _parse(file, blocks, progress=None):
+    try:
+        return list(blocks(iter_stream_paragraphs(file, progress)))
+    except STREAM_ERRORS:
+        file.seek(0)
+        return list(blocks(iter_docx_paragraphs(file, progress)))
+
+
+def parse_question_blocks(file, progress=None):
+    return _parse(file, iter_question_blocks, progress)
+
+
+def parse_open_question_list(file, progress=None):
+    return _parse(file, iter_open_questions, progress)
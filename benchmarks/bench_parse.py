@@ -0,0 +1,44 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bank_parser import iter_docx_paragraphs, iter_question_blocks, iter_stream_paragraphs
+from synthetic import make_bank_docx
+
+
+def measure(fn, data):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn(BytesIO(data))
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description="python-docx və stream parser müqayisəsi")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = ap.parse_args()
+
+    engines = {
+        "python-docx": lambda f: list(iter_question_blocks(iter_docx_paragraphs(f))),
+        "stream": lambda f: list(iter_question_blocks(iter_stream_paragraphs(f))),
+    }
+    print(f"{'suallar':>8} {'mühərrik':>12} {'vaxt (s)':>10} {'pik (MB)':>10}")
+    for n in args.sizes:
+        data = make_bank_docx(n)
+        results = {}
+        for name, fn in engines.items():
+            results[name], elapsed, peak = measure(fn, data)
+            print(f"{n:>8} {name:>12} {elapsed:>10.3f} {peak / 2**20:>10.1f}")
+        assert results["python-docx"] == results["stream"], "nəticələr fərqlidir"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import pickle
+import random
+import sys
+import tracemalloc
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_bank import QuestionBank, shuffle_options
+from synthetic import make_blocks
+
+
+def old_session(blocks):
+    # st.cache_data hər çağırışda nəticənin surətini qaytarır, sonra tuple-lar qurulur
+    questions = pickle.loads(pickle.dumps(blocks))
+    shuffled_questions = []
+    for q_text, opts in questions:
+        correct = opts[0]
+        shuffled = opts[:]
+        random.shuffle(shuffled)
+        shuffled_questions.append((q_text, shuffled, correct))
+    return shuffled_questions, [None] * len(shuffled_questions)
+
+
+def new_session(bank):
+    selected = range(len(bank))
+    return array("I", selected), shuffle_options(bank, selected), array("b", [-1]) * len(selected)
+
+
+def traced(fn, *args):
+    tracemalloc.start()
+    state = fn(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return state, size
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sessiya başına yaddaş: tuple surətləri və QuestionBank indeksləri")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[50, 1500, 20000])
+    args = ap.parse_args()
+
+    print(f"{'suallar':>8} {'köhnə (KB)':>12} {'yeni (KB)':>12} {'bank (KB, paylaşılan)':>22}")
+    for n in args.sizes:
+        blocks = make_blocks(n)
+        _, old_size = traced(old_session, blocks)
+        bank, bank_size = traced(QuestionBank, blocks)
+        _, new_size = traced(new_session, bank)
+        print(f"{n:>8} {old_size / 1024:>12.1f} {new_size / 1024:>12.1f} {bank_size / 1024:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("docx", "lxml", "numpy", "pandas", "openpyxl")
+
+# Hər ölçmə təmiz prosesdə: soyuq start kimi
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+at.run()
+t2 = time.perf_counter()
+at.run()
+t3 = time.perf_counter()
+assert not at.exception, at.exception
+print(json.dumps({
+    "streamlit_import": t1 - t0,
+    "first_render": t2 - t1,
+    "rerun": t3 - t2,
+    "heavy": [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def probe(app):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, str(app), *HEAVY_MODULES],
+        cwd=app.parent, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Ana səhifənin soyuq start və ilk render vaxtı")
+    ap.add_argument("--app", type=Path, default=ROOT / "app.py")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    runs = [probe(args.app.resolve()) for _ in range(args.repeat)]
+    for field in ("streamlit_import", "first_render", "rerun"):
+        values = [r[field] * 1000 for r in runs]
+        print(f"{field:>17}: median {statistics.median(values):8.1f} ms  min {min(values):8.1f} ms")
+    print(f"{'ağır modullar':>17}: {', '.join(runs[-1]['heavy']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
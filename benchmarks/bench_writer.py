@@ -0,0 +1,42 @@
+import argparse
+import random
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bank_parser import parse_question_blocks
+from docx_writer import create_shuffled_docx_and_answers, write_shuffled_docx
+from synthetic import make_blocks
+
+
+def python_docx_writer(questions):
+    new_doc, answer_key = create_shuffled_docx_and_answers(questions)
+    out = BytesIO()
+    new_doc.save(out)
+    return out.getvalue(), answer_key
+
+
+def main():
+    ap = argparse.ArgumentParser(description="python-docx və şablon yazıcısının sürət müqayisəsi")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    args = ap.parse_args()
+
+    writers = {"python-docx": python_docx_writer, "şablon": write_shuffled_docx}
+    print(f"{'suallar':>8} {'yazıcı':>12} {'vaxt (s)':>10} {'sual/s':>10}")
+    for n in args.sizes:
+        questions = make_blocks(n)
+        for name, writer in writers.items():
+            random.seed(n)
+            t0 = time.perf_counter()
+            data, answer_key = writer(questions)
+            elapsed = time.perf_counter() - t0
+            print(f"{n:>8} {name:>12} {elapsed:>10.3f} {n / elapsed:>10.0f}")
+            assert len(parse_question_blocks(BytesIO(data))) == n
+            assert len(answer_key) == n
+
+
+if __name__ == "__main__":
+    main()
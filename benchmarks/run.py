@@ -0,0 +1,119 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+from io import BytesIO
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from adaptive import AdaptiveSampler
+from bank_parser import iter_docx_paragraphs, iter_question_blocks, parse_open_question_list, parse_question_blocks
+from docx_writer import create_shuffled_docx_and_answers, write_shuffled_docx
+from question_bank import QuestionBank, score_answers
+from search_index import SearchIndex
+from synthetic import make_bank_docx, make_blocks, make_open_bank_docx
+
+
+def _adaptive_sampler(n):
+    rng = random.Random(n)
+    attempts = array("I", (rng.randrange(0, 5) for _ in range(n)))
+    return AdaptiveSampler(attempts, array("I", (rng.randrange(0, a + 1) for a in attempts)))
+
+
+def _python_docx_write(blocks):
+    random.seed(0)
+    new_doc, answer_key = create_shuffled_docx_and_answers(blocks)
+    new_doc.save(BytesIO())
+    return answer_key
+
+
+# ad → (hazırlıq(n), ölçülən funksiya(hazırlıq nəticəsi), standart maksimum ölçü)
+BENCHMARKS = {
+    "parse_docx": (make_bank_docx, lambda data: parse_question_blocks(BytesIO(data)), None),
+    "parse_docx[python-docx]": (
+        make_bank_docx, lambda data: list(iter_question_blocks(iter_docx_paragraphs(BytesIO(data)))), 10000),
+    "parse_open_questions": (make_open_bank_docx, lambda data: parse_open_question_list(BytesIO(data)), None),
+    "write_shuffled_docx": (make_blocks, lambda blocks: write_shuffled_docx(blocks, random.Random(0)), None),
+    "create_shuffled_docx_and_answers": (make_blocks, _python_docx_write, 2000),
+    "QuestionBank": (make_blocks, QuestionBank, None),
+    "AdaptiveSampler.sample(50)": (_adaptive_sampler, lambda sampler: sampler.sample(50, random.Random(0)), None),
+    "AdaptiveSampler.record(50)": (
+        _adaptive_sampler, lambda sampler: sampler.record([(i, i % 2) for i in range(min(50, len(sampler)))]), None),
+    "SearchIndex": (make_blocks, SearchIndex, None),
+    "SearchIndex.search": (
+        lambda n: SearchIndex(make_blocks(n)), lambda index: index.search('(hüceyrə | enerji*) -"qanun proses"'), None),
+    "score_answers": (
+        lambda n: array("b", (random.Random(n).randrange(-1, 5) for _ in range(n))), score_answers, None),
+}
+
+
+def measure(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="İsti funksiyaların Streamlit-siz ölçülməsi (vaxt və pik yaddaş)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    ap.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="yalnız bu ölçmələr")
+    ap.add_argument("--repeat", type=int, default=3, help="vaxt üçün ən yaxşı nəticə götürülür")
+    ap.add_argument("--no-limits", action="store_true", help="python-docx ölçmələrini böyük ölçülərdə də işlət")
+    ap.add_argument("--json", type=Path, help="nəticələri JSON faylına yaz")
+    ap.add_argument("--compare", type=Path, help="əvvəlki --json nəticəsi ilə müqayisə et")
+    args = ap.parse_args()
+
+    baseline = {}
+    if args.compare:
+        for r in json.loads(args.compare.read_text(encoding="utf-8"))["results"]:
+            baseline[(r["bench"], r["n"])] = r
+
+    results = []
+    print(f"{'ölçmə':<34} {'n':>7} {'vaxt (ms)':>11} {'pik (MB)':>9} {'əvvəlki ilə':>12}")
+    for n in args.sizes:
+        prepared = {}
+        for name in args.only or BENCHMARKS:
+            setup, fn, limit = BENCHMARKS[name]
+            if limit and n > limit and not args.no_limits:
+                continue
+            if setup not in prepared:
+                prepared[setup] = setup(n)
+            seconds, peak = measure(fn, prepared[setup], args.repeat)
+            results.append({"bench": name, "n": n, "seconds": seconds, "peak_mb": peak / 2**20})
+            old = baseline.get((name, n))
+            ratio = f"{seconds / old['seconds']:>11.2f}x" if old else f"{'-':>12}"
+            print(f"{name:<34} {n:>7} {seconds * 1000:>11.1f} {peak / 2**20:>9.1f} {ratio}")
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from docx_writer import render_docx
+
+WORDS = (
+    "hansı", "aşağıdakı", "sistem", "proses", "funksiya", "məlumat", "şəbəkə", "yaddaş",
+    "alqoritm", "qanun", "dövr", "enerji", "hüceyrə", "tənlik", "struktur", "üsul",
+)
+
+
+def _text(rng, lo, hi):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+# Parser-in qaytardığı formada bloklar: (sual mətni, [doğru cavab, ...])
+def make_blocks(n_questions, seed=0, multiline=0.3):
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(1, n_questions + 1):
+        lines = [f"Sual {i}: {_text(rng, 5, 30)}?"]
+        if rng.random() < multiline:
+            lines += [_text(rng, 3, 12) for _ in range(rng.randint(1, 3))]
+        options = [f"{_text(rng, 1, 6)} {i}.{j}" for j in range(rng.choice((4, 5)))]
+        blocks.append(("\n".join(lines), options))
+    return blocks
+
+
+def bank_paragraphs(blocks, seed=0, noise=0.2):
+    rng = random.Random(seed)
+    paragraphs = ["İmtahan sualları", ""]
+    for idx, (question, options) in enumerate(blocks, start=1):
+        if rng.random() < noise:
+            paragraphs.append(rng.choice(("", f"Mövzu {idx}", _text(rng, 2, 8))))
+        first, *rest = question.split("\n")
+        paragraphs.append(f"{idx}) {first}")
+        paragraphs += rest
+        paragraphs += [f"{chr(ord('A') + j)}) {o}" for j, o in enumerate(options)]
+    return paragraphs
+
+
+def make_bank_docx(n_questions, seed=0, multiline=0.3, noise=0.2):
+    return render_docx(bank_paragraphs(make_blocks(n_questions, seed, multiline), seed, noise))
+
+
+def make_open_bank_docx(n_questions, seed=0):
+    rng = random.Random(seed)
+    return render_docx([f"{i}. {_text(rng, 5, 25)}?" for i in range(1, n_questions + 1)])
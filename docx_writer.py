@@ -0,0 +1,103 @@
+import importlib.util
+import io
+import os
+import random
+import zipfile
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from profiling import stage
+
+# Sabit tarix: eyni giriş eyni .docx baytlarını versin
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+DOCUMENT_PART = "word/document.xml"
+
+
+@lru_cache(maxsize=1)
+def _template():
+    # python-docx-in standart şablonu — Document() ilə eyni üslublar və səhifə ölçüsü.
+    # Paketi import etmədən yalnız faylın yerini tapırıq.
+    spec = importlib.util.find_spec("docx")
+    path = os.path.join(spec.submodule_search_locations[0], "templates", "default.docx")
+    with zipfile.ZipFile(path) as zf:
+        parts = [(name, zf.read(name)) for name in zf.namelist() if name != DOCUMENT_PART]
+        document = zf.read(DOCUMENT_PART).decode("utf-8")
+    split = document.index("<w:sectPr")
+    return parts, document[:split], document[split:]
+
+
+def _paragraph(text):
+    # add_paragraph kimi: "\n" → <w:br/>, "\t" → <w:tab/>
+    runs = []
+    for i, line in enumerate(text.split("\n")):
+        if i:
+            runs.append("<w:br/>")
+        for j, chunk in enumerate(line.split("\t")):
+            if j:
+                runs.append("<w:tab/>")
+            if chunk:
+                runs.append(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>')
+    return f"<w:p><w:r>{''.join(runs)}</w:r></w:p>"
+
+
+def render_docx(paragraphs):
+    parts, head, tail = _template()
+    body = "".join(_paragraph(p) for p in paragraphs)
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in parts:
+            zf.writestr(zip_info(name), data)
+        zf.writestr(zip_info(DOCUMENT_PART), (head + body + tail).encode("utf-8"))
+    return out.getvalue()
+
+
+def zip_info(name):
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def exam_paragraphs(questions, perms):
+    # Doğru cavab orijinal 0-cı variantdır; hərfi permutasiyadakı yerindən tapılır
+    paragraphs = []
+    letters = []
+    for idx, ((question, options), perm) in enumerate(zip(questions, perms), start=1):
+        paragraphs.append(f"{idx}) {question}")
+        for j, o in enumerate(perm):
+            paragraphs.append(f"{chr(ord('A') + j)}) {options[o]}")
+        letters.append(chr(ord('A') + perm.index(0)))
+    return paragraphs, letters
+
+
+def write_shuffled_docx(questions, rng=random):
+    perms = []
+    for _, options in questions:
+        perm = list(range(len(options)))
+        rng.shuffle(perm)
+        perms.append(perm)
+    with stage("exam_paragraphs"):
+        paragraphs, letters = exam_paragraphs(questions, perms)
+    answer_key = [f"{idx}) {letter}" for idx, letter in enumerate(letters, start=1)]
+    with stage("render_docx"):
+        return render_docx(paragraphs), answer_key
+
+
+def create_shuffled_docx_and_answers(questions):
+    from docx import Document
+
+    new_doc = Document()
+    answer_key = []
+
+    for idx, (question, options) in enumerate(questions, start=1):
+        new_doc.add_paragraph(f"{idx}) {question}")
+        correct_answer = options[0]
+        shuffled_options = options[:]
+        random.shuffle(shuffled_options)
+
+        for j, option in enumerate(shuffled_options):
+            letter = chr(ord('A') + j)
+            new_doc.add_paragraph(f"{letter}) {option}")
+            if option.strip() == correct_answer.strip():
+                answer_key.append(f"{idx}) {letter}")
+
+    return new_doc, answer_key
@@ -0,0 +1,100 @@
+import io
+import re
+
+import numpy as np
+import pandas as pd
+
+LETTERS = "ABCDE"
+answer_key_pattern = re.compile(r"^\s*(\d+)\s*[.)]\s*([A-Ea-e])\s*$")
+
+
+# cavab_acari.txt: hər sətirdə "1) B"
+def parse_answer_key(text):
+    key = {}
+    for line in text.splitlines():
+        m = answer_key_pattern.match(line)
+        if m:
+            key[int(m.group(1))] = m.group(2).upper()
+    if not key:
+        raise ValueError("Cavab açarında heç bir \"1) A\" formatlı sətir tapılmadı.")
+    missing = sorted(set(range(1, max(key) + 1)) - set(key))
+    if missing:
+        raise ValueError(f"Cavab açarında çatışmayan suallar: {', '.join(map(str, missing))}")
+    return [key[q] for q in range(1, len(key) + 1)]
+
+
+def _letter_codes(values):
+    # A–E → 0..4, boş və ya tanınmayan → -1
+    letters = pd.Series(values.ravel()).astype("string").str.strip().str.upper()
+    codes = letters.map({letter: i for i, letter in enumerate(LETTERS)}).fillna(-1)
+    return codes.to_numpy(dtype=np.int8).reshape(values.shape)
+
+
+def read_responses(file, name):
+    if name.lower().endswith(".xlsx"):
+        return pd.read_excel(file, dtype=str)
+    return pd.read_csv(file, dtype=str, keep_default_na=False)
+
+
+# Sual sütunları rəqəmlə adlandırılır ("1", "2", ...); qalanları (ad, qrup...) olduğu kimi saxlanılır
+def grade_responses(frame, key):
+    question_columns = [c for c in frame.columns if str(c).strip().isdigit()]
+    numbers = [int(str(c).strip()) for c in question_columns]
+    expected = set(range(1, len(key) + 1))
+    if missing := sorted(expected - set(numbers)):
+        raise ValueError(f"Cavab cədvəlində çatışmayan sual sütunları: {', '.join(map(str, missing))}")
+    columns = [question_columns[numbers.index(q)] for q in range(1, len(key) + 1)]
+
+    responses = _letter_codes(frame[columns].to_numpy(dtype=object))
+    key_codes = np.array([LETTERS.index(k) for k in key], dtype=np.int8)
+    n_students, n_questions = responses.shape
+
+    correct = responses == key_codes
+    scores = correct.sum(axis=1)
+
+    students = frame.drop(columns=question_columns).copy()
+    students["duzgun"] = scores
+    students["sehv"] = ((responses >= 0) & ~correct).sum(axis=1)
+    students["bos"] = (responses < 0).sum(axis=1)
+    students["faiz"] = (scores / n_questions * 100).round(2)
+
+    items = pd.DataFrame({"sual": np.arange(1, n_questions + 1), "acar": list(key)})
+    items["cetinlik"] = correct.mean(axis=0).round(3) if n_students else np.nan
+
+    # Ayırdetmə indeksi: ən yaxşı və ən zəif 27% qrupun düzgün cavab payı fərqi.
+    # Qruplar sıra ilə deyil, bal həddi ilə ayrılır: həddə bərabər bal toplayanların hamısı
+    # qrupa düşür, ona görə eyni ballı tələbələr cədvəldəki sırasından asılı olmayaraq eyni qrupdadır.
+    if n_students:
+        group = max(1, int(round(n_students * 0.27)))
+        ranked = np.sort(scores)
+        lower, upper = correct[scores <= ranked[group - 1]], correct[scores >= ranked[-group]]
+        items["ayirdetme"] = (upper.mean(axis=0) - lower.mean(axis=0)).round(3)
+    else:
+        items["ayirdetme"] = np.nan
+
+    # Düzəldilmiş nöqtə-biserial: sualın özü çıxılmaqla qalan balla korrelyasiya
+    x = correct.astype(float)
+    rest = scores[:, None] - x
+    xc = x - x.mean(axis=0)
+    rc = rest - rest.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_pb = (xc * rc).sum(axis=0) / np.sqrt((xc ** 2).sum(axis=0) * (rc ** 2).sum(axis=0))
+    items["nokte_biserial"] = np.round(r_pb, 3)
+
+    # Variant paylanması: hər sual üçün A–E və boş cavab sayı, bir bincount ilə
+    flat = (responses.astype(np.int64) + 1) + np.arange(n_questions) * (len(LETTERS) + 1)
+    counts = np.bincount(flat.ravel(), minlength=n_questions * (len(LETTERS) + 1))
+    counts = counts.reshape(n_questions, len(LETTERS) + 1)
+    items["bos"] = counts[:, 0]
+    for i, letter in enumerate(LETTERS, start=1):
+        items[letter] = counts[:, i]
+
+    return students, items
+
+
+def export_report(students, items):
+    out = io.BytesIO()
+    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+        students.to_excel(writer, sheet_name="telebeler", index=False)
+        items.to_excel(writer, sheet_name="suallar", index=False)
+    return out.getvalue()
@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ParseCancelled(Exception):
+    pass
+
+
+# Bir faylın fon parse işi. Bir neçə sessiya eyni işi gözləyə bilər; iş yalnız
+# onu gözləyən bütün sessiyalar imtina edəndə dayandırılır.
+class ParseJob:
+    def __init__(self, key):
+        self.key = key
+        self.paragraphs = 0
+        self.fraction = 0.0
+        self.future = None
+        self._owners = set()
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    def attach(self, owner):
+        with self._lock:
+            self._owners.add(owner)
+
+    def detach(self, owner):
+        with self._lock:
+            self._owners.discard(owner)
+            if not self._owners:
+                self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    # Parser hər PROGRESS_EVERY paraqrafdan bir çağırır; ləğv də burada yoxlanılır
+    def progress(self, paragraphs, fraction):
+        if self._cancel.is_set():
+            raise ParseCancelled(self.key)
+        self.paragraphs = paragraphs
+        self.fraction = fraction
+
+
+# Eyni açar (namespace, digest) üçün eyni anda yalnız bir iş işləyir. Bitmiş işin
+# nəticəsi take() ilə götürülənə qədər saxlanılır; götürülməyənlərdən ən köhnələri atılır.
+# Götürülmüş açarlar (nəticə st.cache_data-dadır) məhdud LRU-da yadda saxlanılır ki, disk
+# keşi yazılmasa belə həmin fayl üçün yeni iş başladılmasın.
+class ParseJobs:
+    def __init__(self, max_workers=2, keep_finished=4, remember_taken=256):
+        self.keep_finished = keep_finished
+        self.remember_taken = remember_taken
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parse")
+        self._jobs = OrderedDict()
+        self._taken = OrderedDict()
+        self._lock = threading.RLock()  # artıq bitmiş future-un callback-i submit içində çağırılır
+
+    def submit(self, key, owner, work):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.cancelled():
+                job = self._jobs[key] = ParseJob(key)
+                job.future = self._executor.submit(work, job.progress)
+                job.future.add_done_callback(lambda _, job=job: self._finished(job))
+            job.attach(owner)
+            return job
+
+    def _finished(self, job):
+        with self._lock:
+            if job.future.exception() is not None:
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                return
+            finished = [k for k, j in self._jobs.items() if j.done()]
+            for k in finished[:max(len(finished) - self.keep_finished, 0)]:
+                del self._jobs[k]
+
+    # Bu açar üçün uğurla bitmiş iş var və ya nəticəsi artıq götürülüb. Atılmış işlərin
+    # nəticəsi disk keşindədir (çağıran cache.contains yoxlayır).
+    def ready(self, key):
+        with self._lock:
+            if key in self._taken:
+                self._taken.move_to_end(key)
+                return True
+            job = self._jobs.get(key)
+            return job is not None and job.done() and job.future.exception() is None
+
+    def take(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or not job.done():
+                return False, None
+            del self._jobs[key]
+            if job.future.exception() is None:
+                self._taken[key] = None
+                self._taken.move_to_end(key)
+                if len(self._taken) > self.remember_taken:
+                    self._taken.popitem(last=False)
+        return True, job.future.result()
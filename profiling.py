@@ -0,0 +1,125 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+# IMTAHAN_PROFILE=1 — hər rerun üçün aktiv; IMTAHAN_PROFILE=query — yalnız ?debug=1 olan
+# sessiyalarda. Dəyişən verilməyibsə ?debug nəzərə alınmır və stage() yalnız bir yoxlamadır.
+LOG_PATH = os.environ.get("IMTAHAN_PROFILE_LOG", ".cache/profile.jsonl")
+# Log bu ölçünü keçəndə .1 faylına köçürülür (bir köhnə nüsxə saxlanılır)
+LOG_MAX_BYTES = int(os.environ.get("IMTAHAN_PROFILE_LOG_MAX_BYTES", 10 * 2**20))
+
+# Bu mərhələlərdə mark_cache_miss çağırılmayıbsa, nəticə keşdən gəlib
+CACHED_STAGES = ("parse_docx", "parse_open_questions", "merge_banks", "build_shuffled_exam")
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+def _enabled(st):
+    flag = os.environ.get("IMTAHAN_PROFILE", "").lower()
+    if flag in ("1", "true", "yes"):
+        return True
+    return flag == "query" and st.query_params.get("debug") == "1"
+
+
+def begin_rerun(st, page):
+    # st.rerun() ilə kəsilən əvvəlki run end_rerun-a çatmır — onu burada yazırıq
+    pending = st.session_state.pop("_profile_pending", None)
+    if pending is not None:
+        pending["interrupted"] = True
+        _write(pending)
+
+    if not _enabled(st):
+        _local.run = None
+        return
+    if "_profile_session" not in st.session_state:
+        st.session_state._profile_session = uuid.uuid4().hex[:12]
+    run = {
+        "ts": time.time(),
+        "session": st.session_state._profile_session,
+        "page": page,
+        "stages": [],
+        "_t0": time.perf_counter(),
+        "_last": time.perf_counter(),
+        "_open": [],
+    }
+    st.session_state._profile_pending = run
+    _local.run = run
+
+
+@contextmanager
+def stage(name):
+    run = getattr(_local, "run", None)
+    if run is None:
+        yield
+        return
+    record = {"name": name}
+    run["_open"].append(record)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        run["_last"] = time.perf_counter()
+        record["ms"] = round((run["_last"] - t0) * 1000, 3)
+        run["_open"].pop()
+        run["stages"].append(record)
+
+
+# Keşlənmiş funksiyanın gövdəsindən çağırılır: gövdə yalnız keş qaçanda icra olunur
+def mark_cache_miss():
+    run = getattr(_local, "run", None)
+    if run is not None and run["_open"]:
+        run["_open"][-1]["cache"] = "miss"
+
+
+# extra — yalnız profil aktiv olanda çağırılan, əlavə sahələr qaytaran funksiya
+def end_rerun(st, extra=None):
+    run = st.session_state.pop("_profile_pending", None)
+    _local.run = None
+    if run is None:
+        return
+    run["_last"] = time.perf_counter()
+    run["interrupted"] = False
+    extra = extra() if extra else None
+    if extra:
+        run.update(extra)
+    _mark_cache_hits(run)
+
+    with st.sidebar.expander("🐞 Profil (son rerun)", expanded=False):
+        st.caption(f"Ümumi: {_total_ms(run):.1f} ms")
+        st.dataframe(
+            [{"mərhələ": r["name"], "ms": r["ms"], "keş": r.get("cache", "")} for r in run["stages"]],
+            hide_index=True,
+        )
+        if extra:
+            st.json(extra, expanded=False)
+    _write(run)
+
+
+def _total_ms(run):
+    return round((run["_last"] - run["_t0"]) * 1000, 3)
+
+
+def _mark_cache_hits(run):
+    for record in run["stages"]:
+        if record["name"] in CACHED_STAGES:
+            record.setdefault("cache", "hit")
+
+
+def _write(run):
+    _mark_cache_hits(run)
+    record = {k: v for k, v in run.items() if not k.startswith("_")}
+    record["total_ms"] = _total_ms(run)
+    line = json.dumps(record, ensure_ascii=False)
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(LOG_PATH) or ".", exist_ok=True)
+            if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) >= LOG_MAX_BYTES:
+                os.replace(LOG_PATH, LOG_PATH + ".1")
+            with open(LOG_PATH, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+    except OSError:
+        pass
@@ -0,0 +1,70 @@
+import random
+from array import array
+
+
+# Bir bank üçün bir dəfə qurulur və bütün sessiyalar arasında paylaşılır.
+# Təkrarlanan mətnlər ("Heç biri" və s.) bir dəfə saxlanılır: hər unikal sətir
+# _text içində _offsets ilə, hər yuva isə _ids ilə həmin sətrə istinad edir.
+# Sual i-nin yuvaları _first[i].._first[i+1]: əvvəlcə sual mətni, sonra variantlar.
+class QuestionBank:
+    __slots__ = ("_text", "_offsets", "_ids", "_first")
+
+    def __init__(self, blocks):
+        parts = []
+        seen = {}
+        offsets = array("Q", [0])
+        ids = array("I")
+        first = array("I", [0])
+        for question, options in blocks:
+            for s in (question, *options):
+                k = seen.get(s)
+                if k is None:
+                    k = seen[s] = len(parts)
+                    parts.append(s)
+                    offsets.append(offsets[-1] + len(s))
+                ids.append(k)
+            first.append(len(ids))
+        self._text = "".join(parts)
+        self._offsets = offsets
+        self._ids = ids
+        self._first = first
+
+    def __len__(self):
+        return len(self._first) - 1
+
+    def _string(self, slot):
+        k = self._ids[slot]
+        return self._text[self._offsets[k]:self._offsets[k + 1]]
+
+    def question(self, i):
+        return self._string(self._first[i])
+
+    def option_count(self, i):
+        return self._first[i + 1] - self._first[i] - 1
+
+    def option(self, i, j):
+        return self._string(self._first[i] + 1 + j)
+
+    def options(self, i):
+        return [self.option(i, j) for j in range(self.option_count(i))]
+
+    def block(self, i):
+        return self.question(i), self.options(i)
+
+    def blocks(self, indices=None):
+        for i in range(len(self)) if indices is None else indices:
+            yield self.block(i)
+
+
+# Doğru cavab həmişə orijinal 0-cı variantdır; permutasiya göstərilən sıranı saxlayır
+def shuffle_options(bank, indices, rng=random):
+    perms = []
+    for i in indices:
+        perm = list(range(bank.option_count(i)))
+        rng.shuffle(perm)
+        perms.append(bytes(perm))
+    return perms
+
+
+def score_answers(answers):
+    return sum(1 for a in answers if a == 0)
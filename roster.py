@@ -0,0 +1,91 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+# Sütun → (minimum, maksimum); None — yuxarı hədd yoxdur
+COMMON_COLUMNS = {
+    "kollekvium1": (0, 10),
+    "kollekvium2": (0, 10),
+    "kollekvium3": (0, 10),
+    "serbest1": (0, 5),
+    "serbest2": (0, 5),
+}
+ATTENDANCE_COLUMNS = {
+    "ders_saati": (1, None),
+    "qayib": (0, None),
+}
+SUBJECT_COLUMNS = {
+    "mesqele": {"mesqele_orta": (0, 10)},
+    "lab": {"lab_say": (1, None), "lab_tehvil": (0, None)},
+}
+
+
+def roster_columns(subject):
+    return {**COMMON_COLUMNS, **SUBJECT_COLUMNS[subject], **ATTENDANCE_COLUMNS}
+
+
+def read_roster(file, name):
+    if name.lower().endswith(".xlsx"):
+        return pd.read_excel(file)
+    return pd.read_csv(file)
+
+
+def roster_template(subject):
+    return pd.DataFrame(columns=["ad", *roster_columns(subject)]).to_csv(index=False).encode("utf-8-sig")
+
+
+def compute_roster_scores(frame, subject):
+    columns = roster_columns(subject)
+    missing = [c for c in columns if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Çatışmayan sütunlar: {', '.join(missing)}")
+
+    n = len(frame)
+    v = {c: pd.to_numeric(frame[c], errors="coerce").to_numpy(dtype=float) for c in columns}
+    errors = np.full(n, "", dtype=object)
+
+    def flag(mask, message):
+        errors[mask] = errors[mask] + message + "; "
+
+    for c, (lo, hi) in columns.items():
+        # Boş xana ilə rəqəmə çevrilə bilməyən mətn (məs. "5,5", "yox") ayrıca göstərilir
+        empty = frame[c].isna().to_numpy() | frame[c].astype(str).str.strip().eq("").to_numpy()
+        flag(empty, f"{c} boşdur")
+        flag(np.isnan(v[c]) & ~empty, f"{c} rəqəm deyil")
+        flag(v[c] < lo, f"{c} < {lo}")
+        if hi is not None:
+            flag(v[c] > hi, f"{c} > {hi}")
+    flag(v["qayib"] > v["ders_saati"], "qayib > ders_saati")
+    if subject == "lab":
+        flag(v["lab_tehvil"] > v["lab_say"], "lab_tehvil > lab_say")
+    valid = errors == ""
+
+    h = (v["kollekvium1"] + v["kollekvium2"] + v["kollekvium3"]) / 3 * 1.8   # Kollekvium: 18 bal
+    i = v["serbest1"] + v["serbest2"]                                          # Sərbəst işlər: 10 bal
+    if subject == "mesqele":
+        p = v["mesqele_orta"] * 1.2                                            # Məşğələ: 12 bal
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = v["lab_tehvil"] / v["lab_say"] * 12                            # Laboratoriya işləri: 12 bal
+    with np.errstate(divide="ignore", invalid="ignore"):
+        q = 10 - (v["qayib"] * 2 / v["ders_saati"]) * 10                      # Davamiyyət balı
+    k = h + i + p + q
+    q_limit = np.floor_divide(np.floor_divide(v["ders_saati"], 4), 2)         # İcazə verilən maksimum qayıb
+
+    result = frame.copy()
+    result["kollekvium_bal"] = np.where(valid, h, np.nan).round(2)
+    result["serbest_bal"] = np.where(valid, i, np.nan)
+    result["mesqele_bal" if subject == "mesqele" else "lab_bal"] = np.where(valid, p, np.nan).round(2)
+    result["davamiyyet_bal"] = np.where(valid, q, np.nan).round(2)
+    result["umumi_bal"] = np.where(valid, k, np.nan).round(2)
+    result["qayib_limiti"] = np.where(valid, q_limit, np.nan)
+    result["buraxilir"] = valid & (v["qayib"] <= q_limit)
+    result["xeta"] = pd.Series(errors, index=frame.index).str.rstrip("; ")
+    return result
+
+
+def export_roster(result):
+    out = io.BytesIO()
+    result.to_csv(out, index=False, encoding="utf-8-sig")
+    return out.getvalue()
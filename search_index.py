@@ -0,0 +1,178 @@
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import count
+
+import numpy as np
+
+_word = re.compile(r"\w+")
+_query_token = re.compile(r'\s*(\(|\)|\||"[^"]*"?|-(?=\S)|[^\s()|"]+)')
+
+
+# Hərf fərqsiz açar: i/ı/I/İ ailəsi tək "i"-yə endirilir. Böyük I Azərbaycan mətnində ı,
+# latın sözlərində (COVID, DNA) isə i deməkdir — ayırmaq mümkün olmadığı üçün hamısı eyni sayılır.
+def az_casefold(text):
+    text = unicodedata.normalize("NFKC", text)
+    return text.replace("İ", "i").replace("I", "i").replace("ı", "i").casefold()
+
+
+def tokenize(text):
+    return _word.findall(az_casefold(text))
+
+
+class QueryError(ValueError):
+    pass
+
+
+# Sual + variant mətnləri üzrə tərs indeks. Terminlər əlifba sırası ilə nömrələnir,
+# ona görə prefiks (söz*) sorğusu bitişik termin aralığıdır. Hər termin üçün iki siyahı
+# saxlanılır: sual nömrələri (sıralı, təkrarsız) və sözün bütün banka görə qlobal
+# mövqeləri (ifadə axtarışı üçün). Suallar arasında bir boş mövqe qalır ki, bir sualın
+# sonu ilə növbətinin əvvəli ifadə kimi birləşməsin.
+class SearchIndex:
+    __slots__ = ("_blocks", "_terms", "_docs", "_doc_offsets", "_positions", "_offsets", "_starts")
+
+    def __init__(self, blocks):
+        self._blocks = blocks
+        vocab = defaultdict(count().__next__)  # yeni termin növbəti nömrəni alır
+        term_ids = array("I")
+        lengths = array("I")
+        for qi in range(len(blocks)):
+            tokens = tokenize(self._text(qi))
+            term_ids.extend(map(vocab.__getitem__, tokens))
+            lengths.append(len(tokens))
+
+        lengths = np.frombuffer(lengths, dtype=np.uint32).astype(np.int64)
+        doc_ids = np.repeat(np.arange(len(blocks), dtype=np.uint32), lengths)
+        self._starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+        positions = (np.arange(len(doc_ids), dtype=np.int64) + doc_ids).astype(np.uint32)
+
+        self._terms = sorted(vocab)
+        rank = np.empty(len(vocab), dtype=np.uint32)
+        rank[[vocab[t] for t in self._terms]] = np.arange(len(vocab), dtype=np.uint32)
+        ranked = rank[np.frombuffer(term_ids, dtype=np.uint32)]
+        order = np.argsort(ranked, kind="stable")  # sabit sıralama: mövqelər artan qalır
+        ranked, doc_ids = ranked[order], doc_ids[order]
+        self._positions = positions[order]
+        self._offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ranked, minlength=len(vocab)), out=self._offsets[1:])
+
+        first = np.ones(len(ranked), dtype=bool)  # hər (termin, sual) cütünün ilk rast gəlinməsi
+        first[1:] = (ranked[1:] != ranked[:-1]) | (doc_ids[1:] != doc_ids[:-1])
+        self._docs = doc_ids[first]
+        self._doc_offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ranked[first], minlength=len(vocab)), out=self._doc_offsets[1:])
+
+    def __len__(self):
+        return len(self._blocks)
+
+    def _text(self, qi):
+        question, options = self._blocks[qi]
+        return "\n".join((question, *options))
+
+    def _term_range(self, token, prefix=False):
+        lo = bisect_left(self._terms, token)
+        if prefix:
+            return lo, bisect_left(self._terms, token + "\U0010ffff")
+        return lo, lo + (lo < len(self._terms) and self._terms[lo] == token)
+
+    def _term(self, token, prefix=False):
+        lo, hi = self._term_range(token, prefix)
+        docs = self._docs[self._doc_offsets[lo]:self._doc_offsets[hi]]
+        return docs if hi - lo <= 1 else np.unique(docs)
+
+    def _term_positions(self, token, prefix=False):
+        lo, hi = self._term_range(token, prefix)
+        positions = self._positions[self._offsets[lo]:self._offsets[hi]]
+        return positions if hi - lo <= 1 else np.sort(positions)
+
+    # Dırnaqsız termin (məs. COVID-19 iki sözə bölünür) — sözlərin hamısı olan suallar
+    def _words(self, text):
+        prefix = text.endswith("*")
+        tokens = tokenize(text)
+        if not tokens:
+            raise QueryError(f"Boş axtarış ifadəsi: {text}")
+        result = None
+        for k, token in enumerate(tokens):
+            matches = self._term(token, prefix and k == len(tokens) - 1)
+            result = matches if result is None else np.intersect1d(result, matches, assume_unique=True)
+        return result
+
+    # Sorğu: boşluq = VƏ, OR və ya | = VƏ YA, NOT və ya -söz = İSTİSNA, (...) qruplaşdırma,
+    # "dırnaq içində" ardıcıl sözlər, söz* prefiks. Nəticə: artan sıralı sual indeksləri.
+    def search(self, query):
+        tokens = _query_token.findall(query)
+        if not tokens:
+            return np.arange(len(self), dtype=np.uint32)
+        pos = 0
+
+        def peek():
+            return tokens[pos] if pos < len(tokens) else None
+
+        def parse_or():
+            nonlocal pos
+            result = parse_and()
+            while peek() in ("OR", "|"):
+                pos += 1
+                result = np.union1d(result, parse_and())
+            return result
+
+        def parse_and():
+            nonlocal pos
+            result = None
+            while peek() not in (None, ")", "OR", "|"):
+                if peek() == "AND":
+                    pos += 1
+                    continue
+                negate = peek() in ("NOT", "-")
+                if negate:
+                    pos += 1
+                operand = parse_unary()
+                if negate:
+                    base = np.arange(len(self), dtype=np.uint32) if result is None else result
+                    result = np.setdiff1d(base, operand, assume_unique=True)
+                else:
+                    result = operand if result is None else np.intersect1d(result, operand, assume_unique=True)
+            if result is None:
+                raise QueryError("Operatordan sonra söz gözlənilirdi.")
+            return result
+
+        def parse_unary():
+            nonlocal pos
+            token = peek()
+            if token is None:
+                raise QueryError("Sorğu yarımçıq qalıb.")
+            pos += 1
+            if token == "(":
+                result = parse_or()
+                if peek() != ")":
+                    raise QueryError("Bağlanmayan mötərizə.")
+                pos += 1
+                return result
+            if token in (")", "OR", "|", "AND"):
+                raise QueryError(f"Gözlənilməz simvol: {token}")
+            if token in ("NOT", "-"):
+                return np.setdiff1d(np.arange(len(self), dtype=np.uint32), parse_unary(), assume_unique=True)
+            if token.startswith('"'):
+                return self._exact_phrase(token.strip('"'))
+            return self._words(token)
+
+        result = parse_or()
+        if pos < len(tokens):
+            raise QueryError(f"Gözlənilməz simvol: {tokens[pos]}")
+        return result
+
+    # Ardıcıl sözlər: birinci sözün mövqeyindən sonra j-ci söz j mövqe irəlidə olmalıdır
+    def _exact_phrase(self, text):
+        prefix = text.endswith("*")
+        tokens = tokenize(text)
+        if not tokens:
+            raise QueryError(f"Boş axtarış ifadəsi: {text}")
+        starts = self._term_positions(tokens[0], prefix and len(tokens) == 1)
+        for j, token in enumerate(tokens[1:], start=1):
+            following = self._term_positions(token, prefix and j == len(tokens) - 1)
+            starts = starts[np.isin(starts + np.uint32(j), following, assume_unique=True)]
+        docs = np.searchsorted(self._starts, starts, side="right") - 1
+        return np.unique(docs).astype(np.uint32)
@@ -0,0 +1,55 @@
+import random
+
+from docx_writer import render_docx
+
+
+# Bütün dəst bir keçiddə: hər raund hovuzun yeni permutasiyasıdır və biletlər ardıcıl
+# dilimlərdir. Beləliklə hovuz çatanda heç bir sual təkrarlanmır, çatmayanda isə hər
+# sual floor/ceil(slot/n) dəfə işlənir. Raund sərhədindən keçən biletdə təkrar olmasın
+# deyə, yeni raundun başındakı k-1 yerdən əvvəlki raundun son k-1 sualı çıxarılır.
+def plan_ticket_deck(n_questions, ticket_count, per_ticket=5, seed=None):
+    if n_questions < per_ticket:
+        raise ValueError(f"Hər bilet üçün {per_ticket} sual lazımdır, hovuzda {n_questions} sual var.")
+    rng = random.Random(seed)
+    total = ticket_count * per_ticket
+    overlap = per_ticket - 1
+    sequence = []
+    previous = None
+    while len(sequence) < total:
+        perm = list(range(n_questions))
+        rng.shuffle(perm)
+        if previous is not None and overlap and n_questions >= 2 * overlap:
+            _separate_round(perm, set(previous[-overlap:]), overlap, rng)
+        elif previous is not None and overlap:
+            perm = previous  # hovuz çox kiçikdir: eyni dövrü davam etdiririk
+        sequence.extend(perm[:total - len(sequence)])
+        previous = perm
+    return [sequence[t * per_ticket:(t + 1) * per_ticket] for t in range(ticket_count)]
+
+
+def _separate_round(perm, tail, overlap, rng):
+    bad = [i for i in range(overlap) if perm[i] in tail]
+    if not bad:
+        return
+    candidates = [j for j in range(overlap, len(perm)) if perm[j] not in tail]
+    for i, j in zip(bad, rng.sample(candidates, len(bad))):
+        perm[i], perm[j] = perm[j], perm[i]
+
+
+def deck_usage(deck, n_questions):
+    counts = [0] * n_questions
+    for ticket in deck:
+        for q in ticket:
+            counts[q] += 1
+    used = [c for c in counts if c]
+    return {"used": len(used), "max": max(used, default=0), "min": min(used, default=0)}
+
+
+def render_deck_docx(deck, questions):
+    paragraphs = []
+    for t, ticket in enumerate(deck, start=1):
+        if t > 1:
+            paragraphs.append("")
+        paragraphs.append(f"Bilet №{t}")
+        paragraphs += [f"{i}) {questions[q]}" for i, q in enumerate(ticket, start=1)]
+    return render_docx(paragraphs)
@@ -0,0 +1,92 @@
+import csv
+import io
+import multiprocessing
+import os
+import random
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from docx_writer import exam_paragraphs, render_docx, zip_info
+
+_worker_blocks = None
+
+# Serial yazıcı ~13k sual/s; spawn ilə hovuz qurmaq ~1 s çəkir və Streamlit serverində
+# yeni interpretatorlar açır. Ona görə hovuz yalnız bundan böyük iş həcmində istifadə olunur.
+PARALLEL_MIN_QUESTIONS = 25_000
+
+
+# Variant planı əsas prosesdə qurulur: toxumdan asılı, deterministik və təkrarsız.
+# Hər variant üçün sual sırası və hər sualın variant permutasiyası qaytarılır.
+def plan_variants(blocks, variant_count, seed, question_count=None):
+    n = len(blocks)
+    k = n if question_count is None else min(question_count, n)
+    plans = []
+    seen = set()
+    attempt = 0
+    while len(plans) < variant_count:
+        rng = random.Random(f"{seed}:{len(plans)}:{attempt}")
+        order = rng.sample(range(n), k)
+        perms = []
+        for i in order:
+            perm = list(range(len(blocks[i][1])))
+            rng.shuffle(perm)
+            perms.append(tuple(perm))
+        signature = (tuple(order), tuple(perms))
+        if signature in seen and attempt < 100:
+            attempt += 1
+            continue
+        seen.add(signature)
+        plans.append((order, perms))
+        attempt = 0
+    return plans
+
+
+def render_variant(blocks, order, perms):
+    paragraphs, letters = exam_paragraphs([blocks[i] for i in order], perms)
+    return render_docx(paragraphs), letters
+
+
+def _init_worker(blocks):
+    global _worker_blocks
+    _worker_blocks = blocks
+
+
+def _render_in_worker(plan):
+    return render_variant(_worker_blocks, *plan)
+
+
+def generate_variant_bundle(blocks, variant_count, seed, question_count=None, max_workers=None):
+    plans = plan_variants(blocks, variant_count, seed, question_count)
+    workers = min(max_workers or _available_cpus(), len(plans))
+    total_questions = sum(len(order) for order, _ in plans)
+
+    if workers <= 1 or total_questions < PARALLEL_MIN_QUESTIONS:
+        rendered = [render_variant(blocks, *plan) for plan in plans]
+    else:
+        # spawn: Streamlit serverinin thread-lərini fork etməmək üçün
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(blocks,),
+        ) as pool:
+            rendered = list(pool.map(_render_in_worker, plans))
+
+    width = len(str(variant_count))
+    key = io.StringIO()
+    writer = csv.writer(key)
+    writer.writerow(["variant", "question", "letter"])
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for v, (docx_bytes, letters) in enumerate(rendered, start=1):
+            zf.writestr(zip_info(f"variant_{v:0{width}d}.docx"), docx_bytes)
+            writer.writerows((v, q, letter) for q, letter in enumerate(letters, start=1))
+        zf.writestr(zip_info("cavab_acari.csv"), key.getvalue())
+    return out.getvalue()
+
+
+def _available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
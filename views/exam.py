@@ -0,0 +1,216 @@
+import random
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from bank_loader import QUERY_HELP, filter_questions, get_adaptive_sampler, get_stats_store, load_question_bank, record_exam_results, show_merge_report
+from profiling import stage
+from question_bank import shuffle_options, score_answers
+
+
+# Yalnız bu fraqment hər saniyə yenilənir; parse və imtahan formu yenidən icra olunmur
+@st.fragment(run_every=1)
+def exam_timer():
+    if st.session_state.get("exam_submitted") or not st.session_state.get("exam_start_time"):
+        return
+    elapsed = datetime.now() - st.session_state.exam_start_time
+    remaining = timedelta(minutes=60) - elapsed
+    seconds_left = int(remaining.total_seconds())
+
+    if seconds_left <= 0:
+        st.warning("⏰ Vaxt bitdi! İmtahan tamamlandı.")
+        st.session_state.exam_submitted = True
+        st.rerun()
+    else:
+        mins, secs = divmod(seconds_left, 60)
+        st.info(f"⏳ Qalan vaxt: {mins} dəq {secs} san")
+
+
+def render():
+    st.title("📝 Özünü Sına: İmtahan Rejimi ")
+    uploaded_files = st.file_uploader("📤 İmtahan üçün Word (.docx) fayllarını seçin", type="docx", accept_multiple_files=True)
+    near_duplicates = st.checkbox("🔗 Oxşar (demək olar eyni) sualları da birləşdir", key="exam_near_duplicates")
+    modes = ["🔹 50 təsadüfi sual", "🧠 Adaptiv: 50 sual (səhv edilənlər daha tez-tez)", "🔸 Bütün suallar", "🔻 Aralıqdan sual seçimi"]
+    if get_stats_store() is None:
+        modes.remove("🧠 Adaptiv: 50 sual (səhv edilənlər daha tez-tez)")  # statistika bazası əlçatan deyil
+    mode = st.radio(
+        "📌 Sual seçimi:", 
+        modes,
+        index=0
+    )
+    page_size = st.selectbox("📄 Bir səhifədə sual sayı:", [10, 25, 50, 100], index=2, key="exam_page_size")
+
+    if uploaded_files:
+        digest, bank, merged = load_question_bank(uploaded_files, near_duplicates)
+        show_merge_report(merged, uploaded_files)
+        if not len(bank):
+            st.error("❗ Heç bir sual tapılmadı.")
+        else:
+            if "exam_started" not in st.session_state:
+                st.session_state.exam_started = False
+            if "exam_submitted" not in st.session_state:
+                st.session_state.exam_submitted = False
+            if "exam_start_time" not in st.session_state:
+                st.session_state.exam_start_time = None
+            if "use_timer" not in st.session_state:
+                st.session_state.use_timer = False
+
+            selected = []
+
+            if mode == "🔹 50 təsadüfi sual":
+                with stage("random.sample"):
+                    selected = random.sample(range(len(bank)), min(50, len(bank)))
+                st.session_state.use_timer = True
+
+            elif mode.startswith("🧠"):
+                with stage("adaptive_sample"):
+                    selected = get_adaptive_sampler(digest, len(bank)).sample(50)
+                st.session_state.use_timer = True
+
+            elif mode == "🔸 Bütün suallar":
+                selected = range(len(bank))
+                st.session_state.use_timer = False
+
+            elif mode == "🔻 Aralıqdan sual seçimi":
+                st.markdown(f"💡 Faylda toplam **{len(bank)}** sual tapıldı.")
+                start_q = st.number_input("🔢 Başlanğıc sual nömrəsi", min_value=1, max_value=len(bank), value=1, key="start_q")
+                end_q = st.number_input("🔢 Sonuncu sual nömrəsi", min_value=start_q, max_value=len(bank), value=min(len(bank), start_q + 49), key="end_q")
+            
+                query = st.text_input("🔎 Açar sözlə filtr (istəyə bağlı)", key="exam_query", help=QUERY_HELP)
+                interval_questions = range(start_q - 1, end_q)
+                matches = filter_questions(digest, merged.blocks, query)
+                if matches is not None:
+                    interval_questions = matches[bisect_left(matches, start_q - 1):bisect_left(matches, end_q)]
+                    st.markdown(f"🔎 Aralıqda filtrə uyğun **{len(interval_questions)}** sual var.")
+            
+                # Yeni seçim əlavə olunur
+                available_modes = ["🔢 Ardıcıl", "🎲 Təsadüfi"]
+                if len(interval_questions) >= 50:
+                    available_modes.append("🎯 50 təsadüfi sual")
+            
+                order_mode = st.radio("📑 Sualların sıralanması və sayı:", available_modes, horizontal=True)
+            
+                if st.button("🚀 İmtahana Başla", disabled=not interval_questions):
+                    if order_mode == "🎯 50 təsadüfi sual":
+                        with stage("random.sample"):
+                            selected_questions = random.sample(interval_questions, 50)
+                        st.session_state.use_timer = True
+                    elif order_mode == "🎲 Təsadüfi":
+                        with stage("random.sample"):
+                            selected_questions = random.sample(interval_questions, len(interval_questions))
+                        st.session_state.use_timer = False
+                    else:
+                        selected_questions = interval_questions
+                        st.session_state.use_timer = False
+            
+                    st.session_state.exam_questions = array("I", selected_questions)
+                    with stage("shuffle_options"):
+                        st.session_state.exam_perms = shuffle_options(bank, selected_questions)
+                    st.session_state.exam_answers = array("b", [-1]) * len(selected_questions)
+                    st.session_state.exam_page = 0
+                    st.session_state.exam_start_time = datetime.now()
+                    st.session_state.exam_bank = digest
+                    st.session_state.exam_question_bank = bank
+                    st.session_state.exam_started = True
+                    st.rerun()
+
+
+
+            # Başlamış imtahan başladığı bankla davam edir (paylaşılan obyektə istinad, surət deyil):
+            # sonradan fayl əlavə/silinsə və ya birləşdirmə rejimi dəyişsə, indekslər başqa suala düşmür
+            if st.session_state.exam_started:
+                bank = st.session_state.exam_question_bank
+                if st.session_state.exam_bank != digest:
+                    st.info("ℹ️ Fayllar dəyişib — imtahan başladığı suallarla davam edir. Yeni fayllarla başlamaq üçün imtahanı bitirib yenidən başlayın.")
+
+            if mode != "🔻 Aralıqdan sual seçimi" and not st.session_state.exam_started:
+                if st.button("🚀 İmtahana Başla"):
+                    st.session_state.exam_questions = array("I", selected)
+                    with stage("shuffle_options"):
+                        st.session_state.exam_perms = shuffle_options(bank, selected)
+                    st.session_state.exam_answers = array("b", [-1]) * len(selected)
+                    st.session_state.exam_page = 0
+                    st.session_state.exam_start_time = datetime.now()
+                    st.session_state.exam_bank = digest
+                    st.session_state.exam_question_bank = bank
+                    st.session_state.exam_started = True
+                    st.rerun()
+
+            elif st.session_state.exam_started and not st.session_state.exam_submitted:
+                if st.session_state.get("use_timer", False):
+                    exam_timer()
+                else:
+                    st.info("ℹ️ Bu rejimdə zaman məhdudiyyəti yoxdur.")
+
+                # Yalnız cari səhifənin widget-ləri yaradılır, digər cavablar exam_answers-də qalır
+                total = len(st.session_state.exam_questions)
+                page_count = (total + page_size - 1) // page_size
+                page = min(st.session_state.get("exam_page", 0), page_count - 1)
+                first, last = page * page_size, min(total, (page + 1) * page_size)
+                answered = sum(1 for a in st.session_state.exam_answers if a >= 0)
+                if page_count > 1:
+                    st.caption(f"📄 Səhifə {page + 1} / {page_count} • Cavablandırılıb: {answered} / {total}")
+
+                with st.form("exam_form"):
+                    with stage("exam_form"):
+                        for i in range(first, last):
+                            qi = st.session_state.exam_questions[i]
+                            perm = st.session_state.exam_perms[i]
+                            answer = st.session_state.exam_answers[i]
+                            st.markdown(
+                                f"<b>{i+1})</b><br>{bank.question(qi).replace(chr(10), '<br>')}",
+                                unsafe_allow_html=True
+                            )
+
+                            # Cavabsız sual seçilməmiş qalır (index=None), əks halda ilk variant "cavab" sayılardı
+                            choice = st.radio(
+                                "", list(perm), index=perm.index(answer) if answer >= 0 else None,
+                                key=f"q_{i}", label_visibility="collapsed",
+                                format_func=lambda j, qi=qi: bank.option(qi, j))
+                            st.session_state.exam_answers[i] = -1 if choice is None else choice
+
+                    prev_clicked = next_clicked = False
+                    if page_count > 1:
+                        col_prev, col_next = st.columns(2)
+                        with col_prev:
+                            prev_clicked = st.form_submit_button("⬅️ Əvvəlki səhifə", disabled=page == 0)
+                        with col_next:
+                            next_clicked = st.form_submit_button("Növbəti səhifə ➡️", disabled=page == page_count - 1)
+                    submitted = st.form_submit_button("📤 İmtahanı Bitir")
+                    if prev_clicked or next_clicked:
+                        st.session_state.exam_page = page - 1 if prev_clicked else page + 1
+                        st.rerun()
+                    if submitted:
+                        st.session_state.exam_submitted = True
+                        st.rerun()
+
+            elif st.session_state.exam_submitted:
+                st.success("🎉 İmtahan tamamlandı!")
+                # Nəticələr bir dəfə yazılır; cavabsız qalan suallar statistikaya düşmür
+                if not st.session_state.get("exam_recorded"):
+                    record_exam_results(st.session_state.exam_bank, len(bank), [
+                        (qi, ua == 0) for qi, ua in zip(st.session_state.exam_questions, st.session_state.exam_answers) if ua >= 0])
+                    st.session_state.exam_recorded = True
+                score = score_answers(st.session_state.exam_answers)
+                total = len(st.session_state.exam_questions)
+                percent = (score / total) * 100
+
+                st.markdown(f"### ✅ Nəticə: {score} düzgün cavab / {total} sual")
+                st.markdown(f"<p style='font-size:16px;'>📈 Doğruluq faizi: <strong>{percent:.2f}%</strong></p>", unsafe_allow_html=True)
+                st.progress(score / total)
+
+                with st.expander("📊 Detallı nəticələr"):
+                    for i, (ua, qi) in enumerate(zip(st.session_state.exam_answers, st.session_state.exam_questions)):
+                        status = "✅ Düzgün" if ua == 0 else "❌ Səhv" if ua >= 0 else "⏭️ Cavabsız"
+                        user_answer = bank.option(qi, ua) if ua >= 0 else None
+                        st.markdown(f"**{i+1}) {bank.question(qi)}**\n• Sənin cavabın: {user_answer}\n• Doğru cavab: {bank.option(qi, 0)} → {status}")
+
+                if st.button("🔁 Yenidən Başla"):
+                    keys_to_clear = [k for k in st.session_state if k.startswith("q_") or k in [
+                        "exam_questions", "exam_perms", "exam_answers", "exam_started", "exam_submitted", "exam_start_time", "use_timer", "exam_page",
+                        "exam_bank", "exam_question_bank", "exam_recorded"]]
+                    for key in keys_to_clear:
+                        st.session_state.pop(key)
+                    st.rerun()
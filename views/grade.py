@@ -0,0 +1,26 @@
+import streamlit as st
+
+from grading import export_report, grade_responses, parse_answer_key, read_responses
+
+
+def render():
+    st.title("📋 Cavab Vərəqlərinin Toplu Yoxlanması")
+    key_file = st.file_uploader("📤 Cavab açarı (cavab_acari.txt)", type="txt")
+    responses_file = st.file_uploader("📤 Tələbə cavabları (.csv, .xlsx)", type=["csv", "xlsx"])
+    st.caption("Cavab cədvəlində hər sətir bir tələbədir; sual sütunları 1, 2, 3... adlanır və A–E hərflərini saxlayır. Digər sütunlar (ad, qrup) nəticəyə olduğu kimi köçürülür.")
+
+    if key_file and responses_file:
+        try:
+            key = parse_answer_key(key_file.getvalue().decode("utf-8-sig"))
+            students, items = grade_responses(read_responses(responses_file, responses_file.name), key)
+        except ValueError as exc:
+            st.error(f"❗ {exc}")
+        else:
+            st.success(f"✅ {len(students)} tələbə, {len(key)} sual yoxlanıldı • Orta nəticə: {students['faiz'].mean():.2f}%")
+
+            st.markdown("### 👥 Tələbələr")
+            st.dataframe(students, hide_index=True)
+            st.markdown("### 📊 Sualların təhlili")
+            st.caption("Çətinlik — düzgün cavab payı; ayırdetmə — ən yaxşı və ən zəif 27% qrup arasında fərq; nöqtə-biserial — sualla qalan bal arasında korrelyasiya.")
+            st.dataframe(items, hide_index=True)
+            st.download_button("📥 Hesabat (.xlsx)", export_report(students, items), "yoxlama_hesabati.xlsx", on_click="ignore")
@@ -0,0 +1,121 @@
+import streamlit as st
+
+
+def render():
+    st.title("ℹ️ İstifadə Qaydaları və Yardım")
+    st.markdown("""
+**Xoş gəlmisiniz!** Bu proqram vasitəsilə müxtəlif formatlarda imtahan suallarını sınaqdan keçirə və özünüzü yoxlaya bilərsiniz. Aşağıda əsas funksiyalar, dəstəklənən fayl formatı və necə istifadə ediləcəyi barədə ətraflı məlumat verilmişdir:
+
+---
+
+### 📄 Dəstəklənən fayl formatı:
+Yalnız `.docx` formatında Word sənədləri istifadə olunmalıdır.
+
+### 📝 Test suallarının formatı:
+- Hər bir sual nömrələnmiş olmalıdır:  
+  `1) Bu bir nümunə sualdır?`
+- Variantlar A-dan E-yə qədər olmalıdır:
+
+  A) Doğru cavab  
+  B) Yanlış cavab  
+  C) Yanlış cavab  
+  D) Yanlış cavab  
+  E) Yanlış cavab
+
+- **Diqqət**: Doğru cavab həmişə **birinci** yazılmalıdır (`A)` altında).
+
+### 🧪 Rejimlər haqqında:
+
+#### 📝 Özünü İmtahan Et:
+- 4 rejim mövcuddur:  
+  - **50 təsadüfi sual** (60 dəqiqəlik taymer ilə)  
+  - **Adaptiv** (50 sual, 60 dəqiqə; əvvəlki imtahanlarda tez-tez səhv edilən suallar daha çox düşür)  
+  - **Bütün suallar** (vaxt məhdudiyyəti yoxdur)  
+  - **Aralıqdan seçilmiş suallar** (istədiyiniz aralıqdan seçim; ardıcıl, təsadüfi və ya 50 təsadüfi variantları mövcuddur)  
+    - Aralıq daxilində **açar söz filtri** ilə yalnız müəyyən mövzunun suallarını seçə bilərsiniz (məs. `fotosintez OR xlorofil`, `hüceyrə -bitki`, `\"ardıcıl sözlər\"`, `mitox*`). Böyük/kiçik hərf fərqi yoxdur; i, ı, I və İ eyni hərf sayılır (`COVID` = `covid`, `IŞIQ` = `ışıq`).  
+- Suallar səhifələrə bölünür; bir səhifədəki sual sayını seçə və "Əvvəlki/Növbəti səhifə" düymələri ilə keçid edə bilərsiniz. Digər səhifələrdəki cavablar yadda saxlanılır.  
+- İmtahan zamanı cavablar qeyd olunur və sonunda nəticə, düzgün cavablar göstərilir.  
+- Vaxt bitdikdə imtahan avtomatik tamamlanır.
+- Hər bitmiş imtahanın cavablandırılmış sualları üzrə cəhd və səhv sayları yerli `.cache/stats.sqlite3` bazasında saxlanılır (`IMTAHAN_STATS_DB` ilə dəyişdirilə bilər).
+
+#### 🎲 Sualları Qarışdır:
+- Word sənədindən suallar və variantlar alınır, doğru cavablar qarışdırılır.  
+- Bir neçə `.docx` faylı birlikdə seçilə bilər: eyni suallar avtomatik çıxarılır, istəsəniz **oxşar** (demək olar eyni) suallar da birləşdirilir. Nəticə **Birləşdirmə hesabatı** bölməsində göstərilir (İmtahan rejimində də keçərlidir).  
+- Qarışdırılmış suallar `.docx` faylı, cavab açarı isə `.txt` faylı kimi yüklənə bilər.  
+- Suallar 50 təsadüfi və ya bütün suallar olaraq seçilə bilər.
+- Açar söz filtri yazılıbsa, qarışdırma və variantlar yalnız filtrə uyğun suallardan qurulur.
+- **Çoxlu variant** bölməsində variant sayını və toxumu (seed) seçərək bütün variantları və ümumi cavab açarını (`variant, question, letter` sütunlu `.csv`) bir `.zip` faylında yükləyə bilərsiniz. Eyni toxum eyni variantları verir.
+
+#### 🎫 Bilet İmtahanı (Açıq suallar):
+- Açıq tipli suallardan 5 təsadüfi sual seçilir.  
+- "Bilet Çək" düyməsi ilə yeni suallar seçmək mümkündür.  
+- **Bilet dəsti** bölməsində bilet sayını və toxumu (seed) seçərək bütün sessiyanın biletlərini bir dəfəyə yaradıb bir `.docx` faylı kimi yükləyə bilərsiniz. Sual hovuzu kifayət edirsə, heç bir sual təkrarlanmır; etmirsə, suallar bərabər sayda təkrarlanır. Eyni toxum eyni dəsti verir.
+
+#### 📋 Toplu Yoxlama:
+- Cavab açarını (`cavab_acari.txt`) və tələbələrin cavab cədvəlini (`.csv` və ya `.xlsx`) yükləyin.  
+- Cədvəldə hər sətir bir tələbədir, sual sütunları `1`, `2`, `3`... adlanır və `A`–`E` hərflərini saxlayır; boş xana cavabsız sayılır.  
+- Hər tələbənin nəticəsi, hər sual üzrə çətinlik, ayırdetmə və variantların seçilmə sayı göstərilir və `.xlsx` hesabatı kimi yüklənə bilər.
+
+### ⏱️ Vaxt məhdudiyyəti:
+- **50 sual** rejimində 60 dəqiqəlik vaxt məhdudiyyəti var.  
+- Digər rejimlərdə vaxt məhdudiyyəti yoxdur.
+
+### 📤 Nəticələr:
+- İmtahan tamamlandıqda düzgün və səhv cavablar, nəticə faizi göstərilir.  
+- "Yenidən Başla" düyməsi ilə imtahan təkrar edilə bilər.
+
+### 🧮 Bal Hesablanması Haqqında:
+
+- **Məşğələ fənni üçün bal hesablanması:**
+
+  - Kollekviumların ortalaması 18 baldır (3 kollekviumun orta balı * 1.8).  
+  - 2 sərbəst iş balı toplanır (maksimum 10 bal).  
+  - Məşğələ balı 10 üzərindən daxil edilir və 1.2 ilə vurularaq 12 bal hesablanır.  
+  - Davamiyyət balı maksimum 10 baldır. Qayıb sayı dərs saatının müəyyən faizini keçərsə, bal azaldılır.  
+  - Ümumi bal: kollekvium + sərbəst işlər + məşğələ + davamiyyət.  
+  - Qayıb limiti: (Dərs saatı // 4) // 2, aşılması imtahana buraxılmamağa səbəb olur.
+
+- **Laboratoriya fənni üçün bal hesablanması:**
+
+  - Kollekviumların ortalaması 18 baldır.  
+  - 2 sərbəst iş balı toplanır (maksimum 10 bal).  
+  - Laboratoriya işlərinin sayı və təhvil verilən işlərin nisbətinə görə maksimum 12 bal hesablanır.  
+  - Davamiyyət balı və qayıb limiti məşğələ fənni ilə eynidir.  
+  - Ümumi bal: kollekvium + sərbəst işlər + laboratoriya + davamiyyət.
+
+- **Bal hesablamasında maksimum ballar:**
+
+  | Bal növü            | Maksimum bal |
+  |---------------------|--------------|
+  | Kollekvium          | 18           |
+  | Sərbəst işlər       | 10           |
+  | Məşğələ/Laboratoriya| 12           |
+  | Davamiyyət          | 10           |
+  | **Ümumi maksimum**  | **50**       |
+
+- **Qrup üzrə hesablama:**
+
+  - "👥 Qrup üzrə (CSV/XLSX)" rejimində hər sətirdə bir tələbə olan cədvəl yükləyərək bütün qrupun ballarını və imtahana buraxılma statusunu bir dəfəyə hesablaya bilərsiniz.  
+  - Sütun adları nümunə şablonda verilib; maksimum hədlərdən kənar, boş və rəqəm olmayan (məs. `5,5`) dəyərlər `xeta` sütununda ayrıca göstərilir.  
+  - Nəticələr `.csv` faylı kimi yüklənə bilər.
+
+- **Vacib qeyd:**  
+  - Balın düzgün hesablanması üçün bütün girişlər maksimum hədlərdə olmalıdır.  
+  - Qayıb sayı icazə verilən limitdən çox olarsa, imtahana buraxılmırsınız.
+
+### ⚠️ Əgər:
+- Fayl yüklədikdən sonra sual tapılmırsa, faylın strukturunu yoxlayın.  
+- Sual və variantlar qarışmırsa, variantların düzgün `A)` formatında yazıldığından əmin olun.  
+- Böyük fayl oxunarkən irəliləyiş zolağı göstərilir; düymələri təkrar basmağa ehtiyac yoxdur. **⏹️ Dayandır** ilə oxunmanı dayandıra, sonra **🔁 Yenidən oxu** ilə davam etdirə bilərsiniz.  
+- Zaman bitərsə, imtahan avtomatik tamamlanacaq və nəticələr göstəriləcək.  
+- Problemlə qarşılaşdıqda brauzeri yeniləyin və ya faylı yenidən yükləyin.
+
+### 💡 Əlaqə və Yardım:
+- Əgər çətinlik yaşayırsınızsa, bizimlə əlaqə saxlayın:  
+  - Gmail: ismayilabbasov3032@gmail.com  
+  - Mailru: ismayilabbasov3032@mail.ru
+
+---
+
+Uğurlar və uğurlu nəticələr!
+""")
@@ -0,0 +1,86 @@
+import streamlit as st
+
+from roster import compute_roster_scores, export_roster, read_roster, roster_columns, roster_template
+
+
+def render():
+    st.title("🧮 Bal Hesablaması Sistemi")
+
+    st.markdown("### Fənnin növünü seçin:")
+    subject_type = st.radio("Bu fənn hansı əsasladır?", ["📘 Məşğələ", "🧪 Laboratoriya"])
+
+    calc_mode = st.radio("Hesablama rejimi:", ["👤 Tək tələbə", "👥 Qrup üzrə (CSV/XLSX)"], horizontal=True)
+    subject_key = "mesqele" if subject_type == "📘 Məşğələ" else "lab"
+
+    if calc_mode == "👥 Qrup üzrə (CSV/XLSX)":
+        st.markdown("Hər sətirdə bir tələbə olmaqla cədvəl yükləyin. Sütunlar:")
+        st.code(", ".join(["ad", *roster_columns(subject_key)]))
+        st.download_button("📄 Nümunə şablon (.csv)", roster_template(subject_key), f"sablon_{subject_key}.csv", on_click="ignore")
+        roster_file = st.file_uploader("📤 Tələbə siyahısı (.csv, .xlsx)", type=["csv", "xlsx"])
+
+        if roster_file:
+            try:
+                result = compute_roster_scores(read_roster(roster_file, roster_file.name), subject_key)
+            except ValueError as exc:
+                st.error(f"❗ {exc}")
+            else:
+                invalid = int((result["xeta"] != "").sum())
+                admitted = int(result["buraxilir"].sum())
+                st.success(f"✅ {len(result)} tələbə hesablandı • İmtahana buraxılır: {admitted}")
+                if invalid:
+                    st.warning(f"⚠️ {invalid} sətirdə maksimum hədlərdən kənar, boş və ya rəqəm olmayan dəyər var (xeta sütununa baxın).")
+                st.dataframe(result, hide_index=True)
+                st.download_button("📥 Nəticələr (.csv)", export_roster(result), "bal_neticeleri.csv", on_click="ignore")
+
+    else:
+        # Ümumi girişlər (kollekviumlar)
+        a = st.number_input("1-ci kollekvium balı (maks 10)", min_value=0, max_value=10, step=1)
+        b = st.number_input("2-ci kollekvium balı (maks 10)", min_value=0, max_value=10, step=1)
+        c = st.number_input("3-cü kollekvium balı (maks 10)", min_value=0, max_value=10, step=1)
+
+        if subject_type == "📘 Məşğələ":
+            d = st.number_input("1-ci sərbəst iş balı (maks 5)", min_value=0, max_value=5, step=1)
+            e = st.number_input("2-ci sərbəst iş balı (maks 5)", min_value=0, max_value=5, step=1)
+            mesqele_orta = st.number_input("Məşğələ orta balı (maks 10)", min_value=0.0, max_value=10.0, step=0.1)
+            l = st.number_input("Fənn üzrə dərs saatı (tam ədəd)", min_value=1, step=1)
+            m = st.number_input("Neçə dəfə dərsdən qalmısınız (qayıb sayı)", min_value=0, max_value=l, step=1)
+
+            if st.button("🔢 Balı Hesabla"):
+                h = ((a + b + c) / 3) * 1.8        # Kollekvium: 18 bal
+                i = d + e                         # Sərbəst işlər: 10 bal
+                p = mesqele_orta * 1.2            # Məşğələ: 10 üzərindən daxil olunur → 12 bala miqyaslanır
+                n = m * 2                         # Qayıb x2
+                o = (n / l) * 10                  # Davamiyyət itkisi (maks 10)
+                q = 10 - o                        # Davamiyyət balı
+                k = h + i + p + q                 # Ümumi bal
+                q_limit = l // 4 // 2             # İcazə verilən maksimum qayıb
+
+                st.markdown("---")
+                if m > q_limit:
+                    st.error("🚫 Sizin qayıb sayınız çox olduğundan imtahana buraxılmırsınız!")
+                else:
+                    st.success(f"✅ İmtahan öncəsi topladığınız ümumi bal: **{k:.2f}**")
+
+        elif subject_type == "🧪 Laboratoriya":
+            d = st.number_input("1-ci sərbəst iş balı (maks 5)", min_value=0, max_value=5, step=1)
+            e = st.number_input("2-ci sərbəst iş balı (maks 5)", min_value=0, max_value=5, step=1)
+            f = st.number_input("Laboratoriya işlərinin ümumi sayı (tam ədəd)", min_value=1, step=1)
+            g = st.number_input("Təhvil verilən laboratoriya sayı", min_value=0, max_value=f, step=1)
+            l = st.number_input("Fənn üzrə dərs saatı (tam ədəd)", min_value=1, step=1)
+            m = st.number_input("Neçə dəfə dərsdən qalmısınız (qayıb sayı)", min_value=0, max_value=l, step=1)
+
+            if st.button("🔢 Balı Hesabla"):
+                h = ((a + b + c) / 3) * 1.8        # Kollekvium: 18 bal
+                i = d + e                         # Sərbəst işlər: 10 bal
+                j = (g / f) * 12                  # Laboratoriya işləri: 12 bal
+                n = m * 2                         # Qayıb x2
+                o = (n / l) * 10                  # Davamiyyət itkisi (maks 10)
+                p = 10 - o                        # Davamiyyət balı
+                k = h + i + j + p                 # Ümumi bal
+                q_limit = l // 4 // 2             # İcazə verilən maksimum qayıb
+
+                st.markdown("---")
+                if m > q_limit:
+                    st.error("🚫 Sizin qayıb sayınız çox olduğundan imtahana buraxılmırsınız!")
+                else:
+                    st.success(f"✅ İmtahan öncəsi topladığınız ümumi bal: **{k:.2f}**")
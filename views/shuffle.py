@@ -0,0 +1,72 @@
+import random
+
+import streamlit as st
+
+from bank_loader import QUERY_HELP, bank_files_digest, filter_questions, load_merged_blocks, show_merge_report
+from docx_writer import write_shuffled_docx
+from profiling import mark_cache_miss, stage
+from variants import generate_variant_bundle
+
+
+# Rerun-lar (məs. yükləmə düyməsi) eyni sənədi və eyni cavab açarını alır
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_shuffled_exam(digest, _questions, mode, seed):
+    mark_cache_miss()
+    rng = random.Random(seed)
+    with stage("random.sample"):
+        selected = rng.sample(_questions, min(50, len(_questions))) if "50" in mode else _questions
+    docx_bytes, answer_key = write_shuffled_docx(selected, rng)
+    return docx_bytes, "\n".join(answer_key).encode("utf-8")
+
+
+@st.cache_data(max_entries=8, show_spinner="📦 Variantlar hazırlanır...")
+def build_variant_bundle(digest, _questions, variant_count, seed, question_count):
+    return generate_variant_bundle(_questions, variant_count, seed, question_count)
+
+
+def render():
+    st.title("🎲 Test Suallarını Qarışdır və Cavab Açarı Yarat")
+    uploaded_files = st.file_uploader("📤 Word (.docx) sənədlərini seçin", type="docx", accept_multiple_files=True)
+    near_duplicates = st.checkbox("🔗 Oxşar (demək olar eyni) sualları da birləşdir", key="shuffle_near_duplicates")
+    mode = st.radio("💡 Sualların sayı:", ["🔹 50 təsadüfi sual", "🔸 Bütün suallar"], index=0)
+    query = st.text_input("🔎 Yalnız bu açar sözlərə uyğun suallar (istəyə bağlı)", key="shuffle_query", help=QUERY_HELP)
+
+    if uploaded_files:
+        digest = bank_files_digest(uploaded_files, near_duplicates)
+        merged = load_merged_blocks(uploaded_files, near_duplicates, digest)
+        show_merge_report(merged, uploaded_files)
+        questions = merged.blocks
+        matches = filter_questions(digest, questions, query)
+        if matches is not None:
+            questions = [questions[i] for i in matches]
+            digest = f"{digest}:{query.strip()}"  # qarışdırma və variant keşləri filtrə görə ayrılır
+            st.markdown(f"🔎 Filtrə uyğun **{len(questions)}** sual.")
+        if len(questions) < 5:
+            st.error("❗ Faylda kifayət qədər uyğun sual tapılmadı.")
+        else:
+            if "shuffle_seed" not in st.session_state:
+                st.session_state.shuffle_seed = random.randrange(2**32)
+            with stage("build_shuffled_exam"):
+                output_docx, output_answers = build_shuffled_exam(digest, questions, mode, st.session_state.shuffle_seed)
+
+            st.success("✅ Qarışdırılmış sənədlər hazırdır!")
+            st.download_button("📥 Qarışdırılmış Suallar (.docx)", output_docx, "qarisdirilmis_suallar.docx", on_click="ignore")
+            st.download_button("📥 Cavab Açarı (.txt)", output_answers, "cavab_acari.txt", on_click="ignore")
+            if st.button("🔄 Yenidən Qarışdır"):
+                st.session_state.shuffle_seed = random.randrange(2**32)
+                st.rerun()
+
+            st.markdown("---")
+            st.markdown("### 📦 Çoxlu variant")
+            col1, col2 = st.columns(2)
+            with col1:
+                variant_count = st.number_input("🔢 Variant sayı", min_value=2, max_value=100, value=20, step=1)
+            with col2:
+                variant_seed = st.number_input("🎲 Toxum (seed)", min_value=0, value=0, step=1)
+            variant_params = (digest, int(variant_count), int(variant_seed), mode)
+
+            if st.button("📦 Variantları Yarat"):
+                st.session_state.variant_params = variant_params
+            if st.session_state.get("variant_params") == variant_params:
+                bundle = build_variant_bundle(variant_params[0], questions, int(variant_count), int(variant_seed), 50 if "50" in mode else None)
+                st.download_button("📥 Bütün Variantlar və Cavab Açarı (.zip)", bundle, "variantlar.zip", on_click="ignore")
@@ -0,0 +1,65 @@
+import random
+
+import streamlit as st
+
+from bank_cache import bank_digest
+from bank_loader import parse_open_questions
+from tickets import deck_usage, plan_ticket_deck, render_deck_docx
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_ticket_deck(digest, _questions, ticket_count, seed):
+    deck = plan_ticket_deck(len(_questions), ticket_count, 5, seed)
+    return deck, render_deck_docx(deck, _questions)
+
+
+def render():
+    st.title("🎫 Bilet İmtahanı (Açıq suallar)")
+    uploaded_file = st.file_uploader("📤 Bilet sualları üçün Word (.docx) faylı seçin", type="docx")
+
+    if uploaded_file:
+        questions = parse_open_questions(uploaded_file)
+        if len(questions) < 5:
+            st.error("❗ Kifayət qədər sual yoxdur (minimum 5 tələb olunur).")
+        else:
+            if "ticket_questions" not in st.session_state:
+                st.session_state.ticket_questions = []
+            if "ticket_started" not in st.session_state:
+                st.session_state.ticket_started = False
+
+            if not st.session_state.ticket_started:
+                if st.button("🎟️ Bilet Çək"):
+                    st.session_state.ticket_questions = random.sample(questions, 5)
+                    st.session_state.ticket_started = True
+
+            if st.session_state.ticket_started:
+                st.success("✅ Hazır bilet sualları:")
+                for i, q in enumerate(st.session_state.ticket_questions, 1):
+                    st.markdown(f"<p style='font-size:16px;'><strong>{i})</strong> {q}</p>", unsafe_allow_html=True)
+
+                st.markdown("---")
+                if st.button("🔁 Yenidən Bilet Çək"):
+                    st.session_state.ticket_questions = random.sample(questions,5)
+
+            st.markdown("---")
+            st.markdown("### 🗂️ Bütün sessiya üçün bilet dəsti")
+            col1, col2 = st.columns(2)
+            with col1:
+                ticket_count = st.number_input("🔢 Bilet sayı", min_value=1, max_value=1000, value=25, step=1)
+            with col2:
+                deck_seed = st.number_input("🎲 Toxum (seed)", min_value=0, value=0, step=1, key="deck_seed")
+            deck_params = (bank_digest(uploaded_file.getvalue()), int(ticket_count), int(deck_seed))
+
+            if st.button("🗂️ Dəsti Yarat"):
+                st.session_state.deck_params = deck_params
+            if st.session_state.get("deck_params") == deck_params:
+                deck, deck_docx = build_ticket_deck(deck_params[0], questions, int(ticket_count), int(deck_seed))
+                usage = deck_usage(deck, len(questions))
+                if usage["max"] == 1:
+                    st.success(f"✅ {len(deck)} bilet hazırdır — heç bir sual təkrarlanmır.")
+                else:
+                    st.info(f"ℹ️ {len(deck)} bilet üçün sual hovuzu kifayət etmir: hər sual {usage['min']}–{usage['max']} dəfə istifadə olunur, bir bilet daxilində təkrar yoxdur.")
+                st.download_button("📥 Bilet Dəsti (.docx)", deck_docx, "biletler.docx", on_click="ignore")
+                with st.expander("👀 İlk biletlərə baxış"):
+                    for t, ticket in enumerate(deck[:5], start=1):
+                        st.markdown(f"**Bilet №{t}**\n\n" + "\n".join(f"{i}. {questions[q]}" for i, q in enumerate(ticket, start=1)))